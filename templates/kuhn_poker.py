@@ -1,3 +1,5 @@
+import dataclasses
+import functools
 from dataclasses import replace
 
 import jax
@@ -92,3 +94,175 @@ class KuhnPokerNumpy:
         state = jax.tree.map(lambda x: np.asarray(x), state)
 
         return state
+
+
+# Arrays of the native states are read-only, so they can be shared and cached
+@functools.cache
+def _constant(values: tuple, dtype: type) -> np.ndarray:
+    array = np.array(values, dtype)
+    array.flags.writeable = False
+
+    return array
+
+
+_NO_REWARDS = _constant((0.0, 0.0), np.float32)
+_ALL_ACTIONS = _constant((True, True, True), np.bool_)
+_PLAYER_ACTIONS = _constant((True, True, False), np.bool_)
+_NO_CHANCE_STRATEGY = _constant((-1.0, -1.0, -1.0), np.float32)
+
+
+@dataclasses.dataclass(slots=True)
+class NativeState:
+    current_player: int
+    rewards: np.ndarray
+    terminated: bool
+    truncated: bool
+    legal_action_mask: np.ndarray
+    _step_count: int
+    _cards: np.ndarray
+    _last_action: int
+    _pot: np.ndarray
+    is_chance_node: bool
+    chance_strategy: np.ndarray
+
+    # The observation is computed lazily because tree traversals rarely need it
+    @property
+    def observation(self) -> np.ndarray:
+        player = self.current_player
+
+        # JAX clamps out-of-bounds indices, which happens for the chance player (-1)
+        opponent = min(1 - player, 1)
+
+        observation = np.zeros((7,), np.bool_)
+        observation[self._cards[player]] = True
+        observation[3 + self._pot[player]] = True
+        observation[5 + self._pot[opponent]] = True
+
+        return observation
+
+
+class KuhnPokerNative:
+    """Pure NumPy reimplementation of `KuhnPokerNumpy` without per-step JAX dispatch.
+
+    The states have the same fields and values as the states of `KuhnPokerNumpy`,
+    but scalars are plain Python ints and bools instead of 0-d arrays. Arrays are
+    shared between states and are therefore read-only, same as in `KuhnPokerNumpy`.
+    """
+
+    def init(self, seed: int) -> NativeState:
+        # The initial state does not depend on the seed because the cards are dealt by chance
+        return NativeState(
+            current_player=-1,
+            rewards=_NO_REWARDS,
+            terminated=False,
+            truncated=False,
+            legal_action_mask=_ALL_ACTIONS,
+            _step_count=0,
+            _cards=_constant((-1, -1), np.int32),
+            _last_action=-1,
+            _pot=_constant((0, 0), np.int32),
+            is_chance_node=True,
+            chance_strategy=_constant((1 / 3, 1 / 3, 1 / 3), np.float32),
+        )
+
+    def step(self, state: NativeState, action: int) -> NativeState:
+        action = int(action)
+        is_illegal = not state.legal_action_mask[action]
+        current_player = state.current_player
+
+        if state.terminated or state.truncated:
+            state = replace(state, rewards=_NO_REWARDS)
+        elif state.is_chance_node:
+            state = self._step_chance(state, action)
+        else:
+            state = self._step_player(state, action)
+
+        # Taking an illegal action terminates the game, same as in pgx
+        if is_illegal:
+            rewards = [1.0, 1.0]
+            rewards[current_player] = -1.0
+            state.rewards = _constant(tuple(rewards), np.float32)
+            state.terminated = True
+
+        if state.terminated:
+            state.legal_action_mask = _ALL_ACTIONS
+
+        return state
+
+    def _step_chance(self, state: NativeState, action: int) -> NativeState:
+        cards = state._cards.tolist()
+
+        # The game stays at a chance node until both cards are dealt
+        is_chance_node = cards[0] == -1
+        cards[0 if is_chance_node else 1] = action
+
+        if is_chance_node:
+            chance_strategy = state.chance_strategy.copy()
+            chance_strategy[action] = 0.0
+            chance_strategy /= chance_strategy[0] + chance_strategy[1] + chance_strategy[2]
+            chance_strategy.flags.writeable = False
+
+            action_mask = state.legal_action_mask.copy()
+            action_mask[action] = False
+            action_mask.flags.writeable = False
+        else:
+            chance_strategy = _NO_CHANCE_STRATEGY
+            action_mask = _PLAYER_ACTIONS
+
+        return NativeState(
+            current_player=-1 if is_chance_node else 0,
+            rewards=state.rewards,
+            terminated=state.terminated,
+            truncated=state.truncated,
+            legal_action_mask=action_mask,
+            _step_count=state._step_count + 1,
+            _cards=_constant(tuple(cards), np.int32),
+            _last_action=state._last_action,
+            _pot=state._pot,
+            is_chance_node=is_chance_node,
+            chance_strategy=chance_strategy,
+        )
+
+    def _step_player(self, state: NativeState, action: int) -> NativeState:
+        player = state.current_player
+        pot = state._pot
+
+        if action == 0:
+            pot = pot.tolist()
+            pot[player] += 1
+            pot = _constant(tuple(pot), np.int32)
+
+        terminated = True
+        rewards = [-1.0, -1.0]
+
+        if state._last_action == 0 and action == 1:
+            # Fold
+            rewards[1 - player] = 1.0
+        elif state._last_action == 0 and action == 0:
+            # Call
+            rewards = [-2.0, -2.0]
+            rewards[self._find_winner(state)] = 2.0
+        elif state._last_action == 1 and action == 1:
+            # Check behind
+            rewards[self._find_winner(state)] = 1.0
+        else:
+            terminated = False
+
+        return NativeState(
+            current_player=1 - player,
+            rewards=_constant(tuple(rewards), np.float32) if terminated else _NO_REWARDS,
+            terminated=terminated,
+            truncated=state.truncated,
+            legal_action_mask=_PLAYER_ACTIONS,
+            _step_count=state._step_count + 1,
+            _cards=state._cards,
+            _last_action=action,
+            _pot=pot,
+            is_chance_node=state.is_chance_node,
+            chance_strategy=state.chance_strategy,
+        )
+
+    def _find_winner(self, state: NativeState) -> int:
+        player = state.current_player
+
+        return player if state._cards[player] > state._cards[1 - player] else 1 - player
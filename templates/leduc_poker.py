@@ -1,3 +1,5 @@
+import dataclasses
+import functools
 from dataclasses import replace
 
 import jax
@@ -104,3 +106,233 @@ class LeducPokerNumpy:
         state = jax.tree.map(lambda x: np.asarray(x), state)
 
         return state
+
+
+# Arrays of the native states are read-only, so they can be shared and cached
+@functools.cache
+def _constant(values: tuple, dtype: type) -> np.ndarray:
+    array = np.array(values, dtype)
+    array.flags.writeable = False
+
+    return array
+
+
+# pgx splits the key into one for the first player and one for the (unused) deck permutation
+@functools.cache
+def _draw_first_player(seed: int) -> int:
+    first_player_key, _ = jax.random.split(jax.random.key(seed), 2)
+
+    return int(jax.random.bernoulli(first_player_key))
+
+
+_NO_REWARDS = _constant((0.0, 0.0), np.float32)
+_ALL_ACTIONS = _constant((True, True, True), np.bool_)
+_PLAYER_ACTIONS = _constant((True, True, False), np.bool_)
+
+
+@dataclasses.dataclass(slots=True)
+class NativeState:
+    current_player: int
+    rewards: np.ndarray
+    terminated: bool
+    truncated: bool
+    legal_action_mask: np.ndarray
+    _step_count: int
+    _first_player: int
+    _cards: np.ndarray
+    _last_action: int
+    _chips: np.ndarray
+    _round: int
+    _raise_count: int
+    is_chance_node: bool
+    chance_strategy: np.ndarray
+
+    # The observation is computed lazily because tree traversals rarely need it
+    @property
+    def observation(self) -> np.ndarray:
+        player = self.current_player
+        chips = self._chips.tolist()
+
+        # JAX clamps out-of-bounds indices, which happens for the chance player (-1)
+        opponent = min(1 - player, 1)
+
+        observation = np.zeros((34,), np.bool_)
+        observation[self._cards[player]] = True
+
+        if self._round == 1:
+            observation[3 + self._cards[2]] = True
+
+        # JAX drops out-of-bounds updates, which happens after an illegal raise
+        for index in (6 + chips[player], 20 + chips[opponent]):
+            if index < 34:
+                observation[index] = True
+
+        return observation
+
+
+class LeducPokerNative:
+    """Pure NumPy reimplementation of `LeducPokerNumpy` without per-step JAX dispatch.
+
+    The states have the same fields and values as the states of `LeducPokerNumpy`,
+    but scalars are plain Python ints and bools instead of 0-d arrays. Arrays are
+    shared between states and are therefore read-only, same as in `LeducPokerNumpy`.
+    The seed is only used to draw `_first_player` with the same JAX key split as pgx,
+    which happens once per seed in `init`, so no JAX code runs when stepping.
+    """
+
+    def __init__(self) -> None:
+        # Player action masks indexed by the last action and whether raising is allowed
+        self.action_masks = [
+            [_constant((action != 2, can_raise, action == 1), np.bool_) for can_raise in (0, 1)]
+            for action in range(3)
+        ]
+
+    def init(self, seed: int) -> NativeState:
+        return NativeState(
+            current_player=-1,
+            rewards=_NO_REWARDS,
+            terminated=False,
+            truncated=False,
+            legal_action_mask=_ALL_ACTIONS,
+            _step_count=0,
+            _first_player=_draw_first_player(seed),
+            _cards=_constant((-1, -1, -1), np.int32),
+            _last_action=-1,
+            _chips=_constant((1, 1), np.int32),
+            _round=0,
+            _raise_count=0,
+            is_chance_node=True,
+            chance_strategy=_constant((1 / 3, 1 / 3, 1 / 3), np.float32),
+        )
+
+    def step(self, state: NativeState, action: int) -> NativeState:
+        action = int(action)
+        is_illegal = not state.legal_action_mask[action]
+        current_player = state.current_player
+
+        if state.terminated or state.truncated:
+            state = replace(state, rewards=_NO_REWARDS)
+        elif state.is_chance_node:
+            state = self._step_chance(state, action)
+        else:
+            state = self._step_player(state, action)
+
+        # Taking an illegal action terminates the game, same as in pgx
+        if is_illegal:
+            rewards = [1.0, 1.0]
+            rewards[current_player] = -1.0
+            state.rewards = _constant(tuple(rewards), np.float32)
+            state.terminated = True
+
+        if state.terminated:
+            state.legal_action_mask = _ALL_ACTIONS
+
+        return state
+
+    def _step_chance(self, state: NativeState, action: int) -> NativeState:
+        cards = state._cards.tolist()
+        num_dealt = cards.index(-1)
+        cards[num_dealt] = action
+
+        remaining_cards = [2 - cards.count(card) for card in range(3)]
+        chance_strategy = np.array(remaining_cards, np.float32) / np.float32(sum(remaining_cards))
+        chance_strategy.flags.writeable = False
+
+        is_chance_node = num_dealt == 0
+
+        return NativeState(
+            current_player=-1 if is_chance_node else 0,
+            rewards=state.rewards,
+            terminated=state.terminated,
+            truncated=state.truncated,
+            legal_action_mask=state.legal_action_mask if is_chance_node else _PLAYER_ACTIONS,
+            _step_count=state._step_count + 1,
+            _first_player=state._first_player,
+            _cards=_constant(tuple(cards), np.int32),
+            _last_action=state._last_action,
+            _chips=state._chips,
+            _round=state._round,
+            _raise_count=state._raise_count,
+            is_chance_node=is_chance_node,
+            chance_strategy=chance_strategy,
+        )
+
+    def _step_player(self, state: NativeState, action: int) -> NativeState:
+        player = state.current_player
+        opponent = 1 - player
+        chips = state._chips.tolist()
+
+        if action == 0:
+            chips[player] = chips[opponent]
+        elif action == 1:
+            chips[player] = max(chips) + 2 * (state._round + 1)
+
+        fold = action == 2
+        call = state._last_action != -1 and action == 0
+        round_over = fold or call
+        terminated = round_over and not (state._round == 0 and call)
+
+        rewards = _NO_REWARDS
+
+        if terminated:
+            if fold:
+                outcome = [-1.0, -1.0]
+                outcome[opponent] = 1.0
+            else:
+                outcome = self._compute_showdown_rewards(state)
+
+            # The players win or lose the smaller of their contributions to the pot
+            stake = min(chips)
+            rewards = _constant((outcome[0] * stake, outcome[1] * stake), np.float32)
+
+        if round_over:
+            next_player = state._first_player
+            raise_count = 0
+        else:
+            next_player = opponent
+            raise_count = state._raise_count + (action == 1)
+
+        next_round = state._round + round_over
+
+        # The cards do not change, so neither does the chance strategy of the remaining cards
+        is_chance_node = next_round > 0 and state._cards[2] == -1 and not terminated
+
+        if is_chance_node:
+            next_player = -1
+            action_mask = _constant(tuple(state.chance_strategy > 0), np.bool_)
+        else:
+            action_mask = self.action_masks[action][raise_count < 2]
+
+        return NativeState(
+            current_player=next_player,
+            rewards=rewards,
+            terminated=terminated,
+            truncated=state.truncated,
+            legal_action_mask=action_mask,
+            _step_count=state._step_count + 1,
+            _first_player=state._first_player,
+            _cards=state._cards,
+            _last_action=-1 if round_over else action,
+            _chips=_constant(tuple(chips), np.int32),
+            _round=next_round,
+            _raise_count=raise_count,
+            is_chance_node=is_chance_node,
+            chance_strategy=state.chance_strategy,
+        )
+
+    def _compute_showdown_rewards(self, state: NativeState) -> list[float]:
+        player = state.current_player
+        cards = state._cards.tolist()
+        own_card, opponent_card, public_card = cards[player], cards[1 - player], cards[2]
+
+        if own_card == opponent_card:
+            return [0.0, 0.0]
+
+        win = own_card == public_card or (
+            opponent_card != public_card and own_card > opponent_card
+        )
+
+        rewards = [-1.0, -1.0]
+        rewards[player if win else 1 - player] = 1.0
+
+        return rewards
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from scipy import sparse
 
 
 def evaluate_general_sum(
-    row_matrix: np.ndarray,
-    col_matrix: np.ndarray,
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
     row_strategy: np.ndarray,
     col_strategy: np.ndarray,
 ) -> np.ndarray:
@@ -13,9 +14,9 @@ def evaluate_general_sum(
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
@@ -32,13 +33,15 @@ def evaluate_general_sum(
 
 
 def evaluate_zero_sum(
-    row_matrix: np.ndarray, row_strategy: np.ndarray, col_strategy: np.ndarray
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategy: np.ndarray,
+    col_strategy: np.ndarray,
 ) -> np.ndarray:
     """Compute the expected utility of each player in a zero-sum game.
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
@@ -54,17 +57,90 @@ def evaluate_zero_sum(
     raise NotImplementedError
 
 
+def evaluate_general_sum_batched(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategies: np.ndarray,
+    col_strategies: np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Compute the expected utility of each player for a batch of strategy profiles.
+
+    The `i`-th profile is formed by `row_strategies[i]` and `col_strategies[i]`.
+    The reference implementation evaluates the whole batch using a single
+    contraction instead of calling `evaluate_general_sum` in a loop.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    row_strategies : np.ndarray
+        The row player's strategies stacked into an array of shape (k, n)
+    col_strategies : np.ndarray
+        The column player's strategies stacked into an array of shape (k, m)
+    out : np.ndarray | None
+        An optional array of shape (k, 2) to store the result in
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (k, 2) with the expected utilities of the players for each profile
+    """
+
+    raise NotImplementedError
+
+
+def evaluate_zero_sum_batched(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategies: np.ndarray,
+    col_strategies: np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Compute the expected utility of each player for a batch of profiles in a zero-sum game.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    row_strategies : np.ndarray
+        The row player's strategies stacked into an array of shape (k, n)
+    col_strategies : np.ndarray
+        The column player's strategies stacked into an array of shape (k, m)
+    out : np.ndarray | None
+        An optional array of shape (k, 2) to store the result in
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (k, 2) with the expected utilities of the players for each profile
+    """
+
+    raise NotImplementedError
+
+
 def calculate_best_response_against_row(
-    col_matrix: np.ndarray, row_strategy: np.ndarray
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategy: np.ndarray,
+    chunk_size: int | None = None,
 ) -> np.ndarray:
     """Compute a pure best response for the column player against the row player.
 
+    When `chunk_size` is given, the payoff matrix is streamed in blocks of at most
+    `chunk_size` rows and the expected payoffs of the column player's actions are
+    accumulated block by block. This keeps the peak memory usage constant for
+    payoff matrices backed by `np.memmap` which do not fit into memory.
+
     Parameters
     ----------
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
+    chunk_size : int | None
+        The maximum number of rows of the payoff matrix processed at once, or `None` to
+        process the whole matrix in one go
 
     Returns
     -------
@@ -76,16 +152,26 @@ def calculate_best_response_against_row(
 
 
 def calculate_best_response_against_col(
-    row_matrix: np.ndarray, col_strategy: np.ndarray
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_strategy: np.ndarray,
+    chunk_size: int | None = None,
 ) -> np.ndarray:
     """Compute a pure best response for the row player against the column player.
 
+    When `chunk_size` is given, the payoff matrix is streamed in blocks of at most
+    `chunk_size` rows and the best action is tracked across the blocks using
+    a running maximum. This keeps the peak memory usage constant for payoff
+    matrices backed by `np.memmap` which do not fit into memory.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
     col_strategy : np.ndarray
         The column player's strategy
+    chunk_size : int | None
+        The maximum number of rows of the payoff matrix processed at once, or `None` to
+        process the whole matrix in one go
 
     Returns
     -------
@@ -97,18 +183,26 @@ def calculate_best_response_against_col(
 
 
 def evaluate_row_against_best_response(
-    row_matrix: np.ndarray, col_matrix: np.ndarray, row_strategy: np.ndarray
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategy: np.ndarray,
+    chunk_size: int | None = None,
 ) -> np.float64:
     """Compute the utility of the row player when playing against a best response strategy.
 
+    The `chunk_size` argument is passed on to `calculate_best_response_against_row`.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
+    chunk_size : int | None
+        The maximum number of rows of the payoff matrix processed at once, or `None` to
+        process the whole matrix in one go
 
     Returns
     -------
@@ -120,18 +214,26 @@ def evaluate_row_against_best_response(
 
 
 def evaluate_col_against_best_response(
-    row_matrix: np.ndarray, col_matrix: np.ndarray, col_strategy: np.ndarray
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_strategy: np.ndarray,
+    chunk_size: int | None = None,
 ) -> np.float64:
     """Compute the utility of the column player when playing against a best response strategy.
 
+    The `chunk_size` argument is passed on to `calculate_best_response_against_col`.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     col_strategy : np.ndarray
         The column player's strategy
+    chunk_size : int | None
+        The maximum number of rows of the payoff matrix processed at once, or `None` to
+        process the whole matrix in one go
 
     Returns
     -------
@@ -142,13 +244,27 @@ def evaluate_col_against_best_response(
     raise NotImplementedError
 
 
-def find_strictly_dominated_actions(matrix: np.ndarray) -> np.ndarray:
+def find_strictly_dominated_actions(
+    matrix: np.ndarray, mixed: bool = False, max_workers: int | None = None
+) -> np.ndarray:
     """Find strictly dominated actions for the given normal-form game.
 
+    By default, only actions strictly dominated by another pure action are reported.
+    When `mixed` is set, actions strictly dominated by a mixture of the remaining
+    actions are reported as well. The reference implementation first runs the cheap
+    pure-action check and then, for each surviving action, solves a linear program
+    maximizing the margin by which a mixture of the other actions beats it. The
+    linear programs are solved with `scipy.optimize.linprog` and distributed over a
+    `concurrent.futures.ProcessPoolExecutor`.
+
     Parameters
     ----------
     matrix : np.ndarray
         A payoff matrix of one of the players
+    mixed : bool
+        Whether to also look for actions dominated by mixed strategies
+    max_workers : int | None
+        The number of worker processes used to solve the linear programs when `mixed` is set
 
     Returns
     -------
@@ -180,6 +296,38 @@ def iterated_removal_of_dominated_strategies(
     raise NotImplementedError
 
 
+def iterated_removal_of_dominated_strategies_incremental(
+    row_matrix: np.ndarray, col_matrix: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run Iterated Removal of Dominated Strategies with an incrementally updated dominance index.
+
+    Instead of calling `find_strictly_dominated_actions` on the reduced matrices
+    in every round, the reference implementation maintains, for each player and
+    each ordered pair of actions (a, b), the number of opponent's actions against
+    which `a` is not strictly better than `b`. An action is strictly dominated as
+    soon as one of its counters drops to zero. Removing an opponent's action
+    only decrements the counters it contributed to, and removing an own action
+    only drops the corresponding row and column of the index, so the total work
+    is proportional to the number of removals rather than to the number of rounds.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray
+        The row player's payoff matrix
+    col_matrix : np.ndarray
+        The column player's payoff matrix
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Five-tuple of reduced row and column payoff matrices, remaining row and column actions,
+        and the elimination order as an array of (player, action) pairs, where player 0 is
+        the row player and player 1 is the column player
+    """
+
+    raise NotImplementedError
+
+
 def main() -> None:
     pass
 
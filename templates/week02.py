@@ -3,14 +3,46 @@
 import numpy as np
 
 
-def plot_best_response_value_function(row_matrix: np.ndarray, step_size: float) -> None:
+def compute_best_response_value_function(
+    row_matrix: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, tuple[np.float64, np.float64]]:
+    """Compute the exact best response value function for the row player in a 2xN zero-sum game.
+
+    The value function maps the probability `p` of the first action of the row player
+    to the minimum of the `N` lines `p * row_matrix[0, j] + (1 - p) * row_matrix[1, j]`.
+    The reference implementation sorts the lines by slope and computes their lower
+    envelope in O(N log N) using the convex hull trick. The maximin point is the
+    breakpoint with the highest value, because the envelope is concave.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray
+        The row player's payoff matrix
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, tuple[np.float64, np.float64]]
+        Sorted breakpoints of the envelope in [0, 1] including both endpoints,
+        the values of the envelope at the breakpoints, and the maximin point as a pair
+        of the probability of the first action and the value of the game
+    """
+
+    raise NotImplementedError
+
+
+def plot_best_response_value_function(
+    row_matrix: np.ndarray, step_size: float | None = None
+) -> None:
     """Plot the best response value function for the row player in a 2xN zero-sum game.
 
+    If `step_size` is `None`, the plot is drawn exactly from the breakpoints
+    returned by `compute_best_response_value_function`.
+
     Parameters
     ----------
     row_matrix : np.ndarray
         The row player's payoff matrix
-    step_size : float
+    step_size : float | None
         The step size for the probability of the first action of the row player
     """
 
@@ -48,17 +80,66 @@ def verify_support(
     raise NotImplementedError
 
 
+def verify_supports_batched(
+    matrix: np.ndarray, row_supports: np.ndarray, col_supports: np.ndarray
+) -> list[np.ndarray | None]:
+    """Check a batch of equal-size support pairs at once, see `verify_support`.
+
+    For supports of equal size `s`, the opponent's candidate strategy is the unique
+    solution of a square system consisting of `s - 1` indifference equations and
+    the normalization constraint. The reference implementation stacks the systems of
+    all `k` support pairs into an array of shape (k, s, s) and solves them with
+    a single call to `np.linalg.solve`.
+
+    Systems whose condition number `np.linalg.cond` exceeds `1e12`, including the
+    singular ones, are not trusted and fall back to `verify_support` instead. Like the
+    bounds `x >= 0` of the linear program in `verify_support`, a solution of a square
+    system is only a strategy if all of its entries are non-negative. A solution with
+    an entry below `-1e-9` is therefore rejected (`None`), while entries between
+    `-1e-9` and `0` are clipped to zero.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        A payoff matrix of one of the players
+    row_supports : np.ndarray
+        The row player's supports stacked into an array of shape (k, s)
+    col_supports : np.ndarray
+        The column player's supports stacked into an array of shape (k, s)
+
+    Returns
+    -------
+    list[np.ndarray | None]
+        For each support pair, the opponent's strategy, if it exists, otherwise `None`
+    """
+
+    raise NotImplementedError
+
+
 def support_enumeration(
-    row_matrix: np.ndarray, col_matrix: np.ndarray
+    row_matrix: np.ndarray, col_matrix: np.ndarray, max_workers: int | None = 1
 ) -> list[tuple[np.ndarray, np.ndarray]]:
     """Run the Support Enumeration algorithm and return a list of all Nash equilibria
 
+    The support pairs are enumerated by their sizes. All pairs in which both supports
+    have the same size `s` are stacked and checked with a single call of
+    `verify_supports_batched` per player, and only the pairs of different sizes are
+    checked one by one using `verify_support`.
+
+    When `max_workers` is not 1, the sequence of support pairs is split into
+    contiguous shards of roughly equal size, which are processed by a
+    `concurrent.futures.ProcessPoolExecutor`. The equilibria found in the
+    individual shards are concatenated in the order of the shards, so the
+    result is identical to the serial one regardless of the number of workers.
+
     Parameters
     ----------
     row_matrix : np.ndarray
         The row player's payoff matrix
     col_matrix : np.ndarray
         The column player's payoff matrix
+    max_workers : int | None
+        The number of worker processes, or `None` to use all available processors
 
     Returns
     -------
@@ -69,6 +150,95 @@ def support_enumeration(
     raise NotImplementedError
 
 
+def pruned_support_enumeration(
+    row_matrix: np.ndarray, col_matrix: np.ndarray, first_only: bool = False
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Run Support Enumeration with size ordering and conditional dominance pruning.
+
+    The reference implementation follows the algorithm of Porter, Nudelman and Shoham:
+        1. support sizes are visited by increasing size difference and then by increasing total size
+        2. for a row support `S1`, the set `A2'` of the column player's actions which are
+           not conditionally strictly dominated given `S1` is computed, and `S1` is skipped
+           if one of its actions is conditionally strictly dominated given `A2'`
+        3. only column supports `S2` which are subsets of `A2'` are enumerated, and `S2` is
+           skipped if one of the actions of `S1` is conditionally strictly dominated given `S2`
+        4. the remaining support pairs are checked using `verify_support`
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray
+        The row player's payoff matrix
+    col_matrix : np.ndarray
+        The column player's payoff matrix
+    first_only : bool
+        Whether to stop as soon as the first Nash equilibrium is found
+
+    Returns
+    -------
+    list[tuple[np.ndarray, np.ndarray]]
+        A list of strategy profiles corresponding to found Nash equilibria
+    """
+
+    raise NotImplementedError
+
+
+def lemke_howson(
+    row_matrix: np.ndarray, col_matrix: np.ndarray, initial_label: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find a Nash equilibrium using the Lemke-Howson algorithm.
+
+    The reference implementation shifts both payoff matrices to be strictly positive,
+    builds the two tableaux of the best response polytopes and performs complementary
+    pivoting starting by dropping `initial_label`. Labels `0, ..., n - 1` correspond
+    to the row player's actions and labels `n, ..., n + m - 1` to the column player's
+    actions. Ties in the minimum ratio test are broken lexicographically, so the
+    algorithm terminates even in degenerate games.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray
+        The row player's payoff matrix
+    col_matrix : np.ndarray
+        The column player's payoff matrix
+    initial_label : int
+        The label dropped in the first pivoting step
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        A strategy profile that forms a Nash equilibrium
+    """
+
+    raise NotImplementedError
+
+
+def lemke_howson_all_labels(
+    row_matrix: np.ndarray, col_matrix: np.ndarray, max_workers: int | None = None
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Run Lemke-Howson from all `n + m` initial labels and return the distinct equilibria found.
+
+    The individual runs are independent and are distributed over a
+    `concurrent.futures.ProcessPoolExecutor`. The equilibria are returned in the order
+    of the initial labels which first reached them.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray
+        The row player's payoff matrix
+    col_matrix : np.ndarray
+        The column player's payoff matrix
+    max_workers : int | None
+        The number of worker processes, or `None` to use all available processors
+
+    Returns
+    -------
+    list[tuple[np.ndarray, np.ndarray]]
+        A list of distinct strategy profiles corresponding to found Nash equilibria
+    """
+
+    raise NotImplementedError
+
+
 def main() -> None:
     pass
 
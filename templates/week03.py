@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Literal, TypeVar
+
 import numpy as np
+from scipy import sparse
+
+Profile = TypeVar('Profile')
 
 
 def compute_deltas(
-    row_matrix: np.ndarray,
-    col_matrix: np.ndarray,
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
     row_strategy: np.ndarray,
     col_strategy: np.ndarray,
 ) -> np.ndarray:
@@ -13,9 +20,9 @@ def compute_deltas(
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
@@ -32,8 +39,8 @@ def compute_deltas(
 
 
 def compute_nash_conv(
-    row_matrix: np.ndarray,
-    col_matrix: np.ndarray,
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
     row_strategy: np.ndarray,
     col_strategy: np.ndarray,
 ) -> np.float64:
@@ -41,9 +48,9 @@ def compute_nash_conv(
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
@@ -60,8 +67,8 @@ def compute_nash_conv(
 
 
 def compute_exploitability(
-    row_matrix: np.ndarray,
-    col_matrix: np.ndarray,
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
     row_strategy: np.ndarray,
     col_strategy: np.ndarray,
 ) -> np.float64:
@@ -69,9 +76,9 @@ def compute_exploitability(
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     row_strategy : np.ndarray
         The row player's strategy
@@ -88,7 +95,11 @@ def compute_exploitability(
 
 
 def fictitious_play(
-    row_matrix: np.ndarray, col_matrix: np.ndarray, num_iters: int, naive: bool
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    naive: bool,
+    chunk_size: int | None = None,
 ) -> list[tuple[np.ndarray, np.ndarray]]:
     """Run Fictitious Play for a given number of iterations.
 
@@ -96,17 +107,49 @@ def fictitious_play(
     average strategy vectors using a moving average. Therefore, it is recommended
     to use the same averaging method to avoid numerical discrepancies during testing.
 
+    Since every best response is a pure action, the reference solution does not
+    recompute the expected payoffs against the average strategies from scratch.
+    Instead, it keeps running sums of the payoff vectors and adds a single row of
+    `col_matrix` or column of `row_matrix` for each new best response, so that an
+    iteration costs O(n + m) plus an argmax. In the naive version, the payoff vector
+    is simply the row or column corresponding to the opponent's last best response.
+
+    The first returned profile consists of each player's best response to the
+    uniform strategy of the opponent, and all later best responses are computed
+    against the average (or, in the naive version, the last) opponent's strategy.
+    Every best response is the action with the lowest index among those whose
+    expected payoff is within 1e-9 of the maximum. Exact ties are common in the
+    classical games, and this rule makes the incremental and the recomputed payoff
+    vectors produce identical trajectories. The running sums equal the expected
+    payoffs multiplied by the number of averaged profiles, so the tolerance is
+    scaled by the same factor when comparing them.
+
+    Each iteration reads one row of `col_matrix` and one column of `row_matrix`, so both
+    reads have to be contiguous. For games with `np.memmap`-backed payoff matrices larger
+    than the available memory, `col_matrix` is therefore expected in row-major and
+    `row_matrix` in column-major order (e.g. saved from `np.asfortranarray`), so that the
+    column of `row_matrix` is a contiguous row of `row_matrix.T`. The payoff vectors
+    against the uniform strategies are computed once in blocks of `chunk_size` rows of
+    `col_matrix` and of `row_matrix.T`, so that every block is contiguous as well.
+    Similarly, a column slice of a CSR matrix scans all of its non-zeros. The reference
+    solution therefore converts a sparse `row_matrix` to CSC and a sparse `col_matrix`
+    to CSR once, after which every update only adds the non-zeros of a single column
+    or row.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     num_iters : int
         The number of iterations to run the algorithm for
     naive : bool
         Whether to calculate the best response against the last
         opponent's strategy or the average opponent's strategy
+    chunk_size : int | None
+        The maximum number of rows of `col_matrix` and of `row_matrix.T` processed at once,
+        or `None` to process the whole matrices in one go
 
     Returns
     -------
@@ -117,24 +160,280 @@ def fictitious_play(
     raise NotImplementedError
 
 
+def fictitious_play_batched(
+    row_matrices: np.ndarray,
+    col_matrices: np.ndarray,
+    row_masks: np.ndarray,
+    col_masks: np.ndarray,
+    num_iters: int,
+    naive: bool,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Run Fictitious Play on a batch of games in lockstep.
+
+    All games are advanced simultaneously using vectorized operations over the
+    leading axis. Padded actions never become best responses, which the reference
+    solution ensures by setting their expected payoffs to `-np.inf` before taking
+    the argmax. For each game, the result matches `fictitious_play` run on the
+    unpadded payoff matrices.
+
+    Parameters
+    ----------
+    row_matrices : np.ndarray
+        The row players' payoff matrices zero-padded into an array of shape (g, n, m)
+    col_matrices : np.ndarray
+        The column players' payoff matrices zero-padded into an array of shape (g, n, m)
+    row_masks : np.ndarray
+        Boolean array of shape (g, n) marking the row players' legal actions
+    col_masks : np.ndarray
+        Boolean array of shape (g, m) marking the column players' legal actions
+    num_iters : int
+        The number of iterations to run the algorithm for
+    naive : bool
+        Whether to calculate the best response against the last
+        opponent's strategy or the average opponent's strategy
+
+    Returns
+    -------
+    list[tuple[np.ndarray, np.ndarray]]
+        The sequence of average strategy profiles stacked into arrays of shape (g, n) and (g, m),
+        with zero probability assigned to padded actions
+    """
+
+    raise NotImplementedError
+
+
+def log_spaced_checkpoints(num_iters: int, num_checkpoints: int) -> np.ndarray:
+    """Generate roughly logarithmically spaced iteration numbers.
+
+    Parameters
+    ----------
+    num_iters : int
+        The total number of iterations
+    num_checkpoints : int
+        The maximum number of checkpoints
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique iteration numbers between 1 and `num_iters`, always including both
+    """
+
+    raise NotImplementedError
+
+
+def fictitious_play_stream(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    naive: bool,
+    checkpoints: np.ndarray | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Fictitious Play and lazily yield the average strategy profiles.
+
+    Only the current average strategies are kept in memory, so the memory usage does
+    not depend on `num_iters`. Without `checkpoints`, the generator yields the same
+    sequence of profiles as `fictitious_play`, whose memory layout requirements for
+    `np.memmap`-backed and sparse payoff matrices apply here as well.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    num_iters : int
+        The number of iterations to run the algorithm for
+    naive : bool
+        Whether to calculate the best response against the last
+        opponent's strategy or the average opponent's strategy
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the average
+        strategy profile is yielded, or `None` to yield it after every iteration
+    chunk_size : int | None
+        The maximum number of rows of `col_matrix` and of `row_matrix.T` processed at once,
+        or `None` to process the whole matrices in one go
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the average strategy profile at the next checkpoint
+    """
+
+    raise NotImplementedError
+
+
+def run_with_early_stopping(
+    strategies: Iterable[Profile],
+    exploitability: Callable[[Profile], float],
+    eps: float,
+    time_budget: float | None = None,
+    check_ratio: float = 2.0,
+) -> tuple[Profile, dict[str, float]]:
+    """Consume a stream of strategy profiles until it is sufficiently close to an equilibrium.
+
+    The stream is consumed until the exploitability drops to `eps`, the wall clock time
+    exceeds `time_budget` or the stream is exhausted, whichever comes first. Reading the
+    clock is cheap, so the time budget is checked after every consumed profile and the
+    budget is overshot by at most a single iteration of the solver. The exploitability
+    is expensive, so it is only checked at iterations 1, 2, 4, 8, ... (for the default
+    `check_ratio`), which keeps the overhead of the checks a small fraction of the total
+    running time. The last consumed profile is always checked as well, so that the
+    reported exploitability is exact.
+
+    The function works with any solver which yields its average strategies lazily,
+    such as `fictitious_play_stream`, `regret_minimization_stream` from week 6 or the
+    extensive-form solvers from later weeks together with their own exploitability function.
+
+    Parameters
+    ----------
+    strategies : Iterable[Profile]
+        The stream of strategy profiles produced by a solver
+    exploitability : Callable[[Profile], float]
+        A function computing the exploitability of a strategy profile
+    eps : float
+        The target exploitability
+    time_budget : float | None
+        The maximum wall clock time in seconds, or `None` for no limit
+    check_ratio : float
+        The ratio between the iteration numbers of two consecutive checks
+
+    Returns
+    -------
+    tuple[Profile, dict[str, float]]
+        The last consumed strategy profile and a report containing the number of
+        consumed profiles under 'iterations', the elapsed time in seconds under
+        'elapsed_time' and the final exploitability under 'exploitability'
+    """
+
+    raise NotImplementedError
+
+
+def compute_exploitability_trace(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    row_strategies: np.ndarray,
+    col_strategies: np.ndarray,
+    chunk_size: int = 1024,
+) -> np.ndarray:
+    """Compute the exploitability of a batch of strategy profiles.
+
+    The `i`-th profile is formed by `row_strategies[i]` and `col_strategies[i]`.
+    The profiles are processed in chunks of at most `chunk_size` profiles, and each
+    chunk is evaluated using a few matrix products instead of calling
+    `compute_exploitability` for every profile.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    row_strategies : np.ndarray
+        The row player's strategies stacked into an array of shape (k, n)
+    col_strategies : np.ndarray
+        The column player's strategies stacked into an array of shape (k, m)
+    chunk_size : int
+        The maximum number of profiles evaluated at once
+
+    Returns
+    -------
+    np.ndarray
+        A vector of `k` exploitability values
+    """
+
+    raise NotImplementedError
+
+
+def downsample_trace(
+    iterations: np.ndarray,
+    values: np.ndarray,
+    num_points: int,
+    method: Literal['log', 'lttb'] = 'log',
+) -> tuple[np.ndarray, np.ndarray]:
+    """Select at most `num_points` points of a convergence trace for plotting.
+
+    The 'log' method keeps the points closest to logarithmically spaced iteration
+    numbers, while the 'lttb' method uses the Largest-Triangle-Three-Buckets algorithm
+    to preserve the visual shape of the trace. Both methods keep the first and the
+    last point.
+
+    Parameters
+    ----------
+    iterations : np.ndarray
+        Sorted iteration numbers of the trace
+    values : np.ndarray
+        The values of the trace, e.g. exploitability
+    num_points : int
+        The maximum number of points to keep
+    method : Literal['log', 'lttb']
+        The downsampling method
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The selected iteration numbers and the corresponding values
+    """
+
+    raise NotImplementedError
+
+
+def save_exploitability_trace(
+    path: str | Path, iterations: np.ndarray, exploitability: np.ndarray, label: str
+) -> None:
+    """Save a raw exploitability trace into a compressed `.npz` file.
+
+    The file contains the arrays `iterations`, `exploitability` and `label`.
+
+    Parameters
+    ----------
+    path : str | Path
+        The path of the output file
+    iterations : np.ndarray
+        The iteration numbers of the trace
+    exploitability : np.ndarray
+        The exploitability values of the trace
+    label : str
+        The name of the algorithm that produced the trace
+    """
+
+    raise NotImplementedError
+
+
 def plot_exploitability(
-    row_matrix: np.ndarray,
-    col_matrix: np.ndarray,
-    strategies: list[tuple[np.ndarray, np.ndarray]],
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    strategies: Iterable[tuple[np.ndarray, np.ndarray]],
     label: str,
+    iterations: np.ndarray | None = None,
+    max_points: int | None = None,
+    trace_path: str | Path | None = None,
 ) -> list[np.float64]:
     """Compute and plot the exploitability of a sequence of strategy profiles.
 
+    The strategy profiles are consumed lazily in chunks, so `strategies` can be
+    a generator such as `fictitious_play_stream`. Each chunk is evaluated using
+    `compute_exploitability_trace`. The whole trace is returned and optionally saved
+    using `save_exploitability_trace`, but only the points selected by
+    `downsample_trace` are plotted.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
-    strategies : list[tuple[np.ndarray, np.ndarray]]
+    strategies : Iterable[tuple[np.ndarray, np.ndarray]]
         The sequence of strategy profiles
     label : str
         The name of the algorithm that produced `strategies`
+    iterations : np.ndarray | None
+        The iteration numbers of the strategy profiles used for the x-axis,
+        or `None` if the profiles correspond to consecutive iterations
+    max_points : int | None
+        The maximum number of plotted points, or `None` to plot all of them
+    trace_path : str | Path | None
+        The path of an `.npz` file to save the raw trace into, or `None` to skip saving
 
     Returns
     -------
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 
+from typing import Literal
+
 import numpy as np
+from scipy import sparse
 
 
-def find_nash_equilibrium(row_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+def find_nash_equilibrium(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+) -> tuple[np.ndarray, np.ndarray]:
     """Find a Nash equilibrium in a zero-sum normal-form game using linear programming.
 
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
 
     Returns
@@ -20,19 +25,181 @@ def find_nash_equilibrium(row_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarra
     raise NotImplementedError
 
 
-def find_correlated_equilibrium(row_matrix: np.ndarray, col_matrix: np.ndarray) -> np.ndarray:
-    """Find a correlated equilibrium in a normal-form game using linear programming.
+class NashEquilibriumSolver:
+    """A linear programming solver for sequences of zero-sum games of the same size.
+
+    Unlike `find_nash_equilibrium`, which builds a new linear program for every game,
+    the solver builds the two linear programs (one for each player) only once using
+    `highspy.Highs` and keeps them alive between calls of `solve`. Each call only
+    updates the coefficients corresponding to the payoff matrix in place and
+    re-optimizes with the dual simplex method starting from the basis of the
+    previous solve. This is much faster when solving a sequence of slightly
+    perturbed games, and re-solving an unchanged game takes no simplex iterations.
+
+    Parameters
+    ----------
+    num_rows : int
+        The number of the row player's actions
+    num_cols : int
+        The number of the column player's actions
+
+    Attributes
+    ----------
+    solve_time : float
+        The wall clock time in seconds spent by the last call of `solve`
+    num_iterations : int
+        The total number of simplex iterations performed by the last call of `solve`
+    """
+
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        raise NotImplementedError
+
+    def solve(
+        self, row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find a Nash equilibrium in a zero-sum game, warm-starting from the previous solve.
+
+        Parameters
+        ----------
+        row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+            The row player's payoff matrix of shape (num_rows, num_cols)
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            A strategy profile that forms a Nash equilibrium
+        """
+
+        raise NotImplementedError
+
+
+def build_correlated_equilibrium_constraints(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+) -> sparse.csr_array:
+    """Build the incentive constraints of the correlated equilibrium linear program.
+
+    The variables are the probabilities of the joint actions `(a, b)` ordered as `a * m + b`.
+    The first `n * (n - 1)` rows correspond to the row player's recommendation-deviation pairs
+    `(a, a')` with `a != a'` in lexicographic order, followed by `m * (m - 1)` rows for the
+    column player's pairs `(b, b')`. The row for `(a, a')` contains the gains
+    `row_matrix[a', b] - row_matrix[a, b]` in the columns of the joint actions `(a, b)`,
+    so a distribution `x` satisfies the constraints if and only if `A @ x <= 0`.
+
+    The reference implementation never materializes a dense block. It computes
+    the row, column and value arrays of all non-zero entries using vectorized index
+    arithmetic and assembles them into a COO array, which is converted to CSR.
+    The result has at most `n * m * (n + m)` non-zero entries.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+
+    Returns
+    -------
+    sparse.csr_array
+        The constraint matrix of shape (n * (n - 1) + m * (m - 1), n * m)
+    """
+
+    raise NotImplementedError
+
+
+def compute_correlated_equilibrium_gap(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    distribution: np.ndarray,
+) -> np.float64:
+    """Compute how far a distribution over joint actions is from a correlated equilibrium.
+
+    The gap is the largest expected gain any player can obtain by deviating from
+    a single recommended action, i.e. the largest entry of `A @ x` for the constraint
+    matrix `A` from `build_correlated_equilibrium_constraints`, clipped at zero.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    distribution : np.ndarray
+        A distribution over joint actions
+
+    Returns
+    -------
+    np.float64
+        The correlated equilibrium gap, which is zero for correlated equilibria
+    """
+
+    raise NotImplementedError
+
+
+def find_correlated_equilibrium(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    method: Literal['lp', 'column_generation', 'regret_matching'] = 'lp',
+    eps: float = 1e-6,
+    max_iters: int = 100_000,
+) -> np.ndarray:
+    """Find a correlated equilibrium in a normal-form game.
 
     While the cost vector could be selected to optimize a particular objective, such as
     maximizing the sum of players’ utilities, the reference solution sets it to the zero
     vector to ensure reproducibility during testing.
 
+    The available methods are:
+        - 'lp' builds the incentive constraints using `build_correlated_equilibrium_constraints`
+          and passes them to `scipy.optimize.linprog` in sparse form
+        - 'column_generation' solves the restricted primal LP over a growing set of
+          joint actions, as described below
+        - 'regret_matching' lets both players minimize their swap regret deterministically,
+          as described below, and returns the average of the outer products of their
+          strategies once its gap drops to `eps`
+
+    The 'column_generation' method starts from the joint action (0, 0). In each
+    iteration, it solves the restricted primal LP over the selected joint actions,
+    which minimizes the largest incentive constraint t subject to the probabilities
+    summing to one and being non-negative. This t is the correlated equilibrium gap of
+    the restricted solution, and the method stops once t <= `eps`. Otherwise, it uses
+    the duals of the incentive constraints (y >= 0) and of the normalization
+    constraint (mu, which equals the optimal t) to price the joint actions which are
+    not yet included. The reduced cost of a joint action is mu minus the dot product
+    of y with its column of incentive constraints, i.e. the rate at which t decreases
+    when the joint action enters, and all joint actions with a reduced cost above 1e-9
+    are added. If there is none, the restricted solution is optimal for the full LP,
+    whose gap is never positive.
+
+    In the 'regret_matching' method, each player keeps a matrix of cumulative regrets
+    whose entry (i, j) is the regret for playing action j whenever action i was
+    recommended. Each row is turned into a strategy by `regret_matching` from week 6,
+    except that rows without any positive regret keep the recommended action. The rows
+    form a stochastic matrix Q, and the player's strategy is its stationary distribution,
+    i.e. the solution of p Q = p with p summing to one. The reference solution computes
+    it using `np.linalg.lstsq`, which selects the minimum-norm solution if the stationary
+    distribution is not unique. The regrets of each recommended action are then
+    updated in expectation, weighted by its probability under p, against the opponent's
+    current strategy. No joint actions are sampled, so the result is reproducible.
+
+    The gap of the iterative methods is checked after every iteration. If it is still
+    larger than `eps` after `max_iters` iterations, the current distribution is returned
+    anyway, i.e. the restricted LP solution or the average after `max_iters` iterations.
+    The last two methods are intended for games which are too large for the full LP.
+    Use `compute_correlated_equilibrium_gap` to measure the accuracy of their results.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
+    method : Literal['lp', 'column_generation', 'regret_matching']
+        The method used to find the correlated equilibrium
+    eps : float
+        The required correlated equilibrium gap for the iterative methods
+    max_iters : int
+        The maximum number of iterations of the iterative methods
 
     Returns
     -------
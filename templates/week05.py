@@ -1,7 +1,71 @@
 #!/usr/bin/env python3
 
+from collections.abc import Callable
+
 import numpy as np
 
+ArrayPair = tuple[np.ndarray, np.ndarray]
+
+
+class RestrictedGameSolver:
+    """An incrementally growing restricted zero-sum game with a warm-started LP solver.
+
+    The payoffs of the restricted game are stored in a preallocated buffer whose
+    capacity is doubled whenever it runs out of space, so appending an action costs
+    amortized O(n + m). The linear programs of both players are kept alive in
+    `highspy.Highs` models. Adding an action of the row player appends a column to
+    the row player's LP and a constraint to the column player's LP (and vice versa),
+    after which the models are re-optimized starting from the previous basis.
+
+    Attributes
+    ----------
+    row_actions : np.ndarray
+        The row player's actions in the restricted game in the order of addition
+    col_actions : np.ndarray
+        The column player's actions in the restricted game in the order of addition
+    """
+
+    def __init__(self, initial_capacity: int = 16) -> None:
+        raise NotImplementedError
+
+    def add_row(self, action: int, payoffs: np.ndarray) -> None:
+        """Add an action of the row player to the restricted game.
+
+        Parameters
+        ----------
+        action : int
+            The index of the action in the full game
+        payoffs : np.ndarray
+            The row player's payoffs against the column player's actions in `col_actions`
+        """
+
+        raise NotImplementedError
+
+    def add_col(self, action: int, payoffs: np.ndarray) -> None:
+        """Add an action of the column player to the restricted game.
+
+        Parameters
+        ----------
+        action : int
+            The index of the action in the full game
+        payoffs : np.ndarray
+            The row player's payoffs for the row player's actions in `row_actions`
+        """
+
+        raise NotImplementedError
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray, np.float64]:
+        """Find a Nash equilibrium of the current restricted game.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.float64]
+            The row and column player's strategies over `row_actions` and `col_actions`,
+            and the value of the restricted game
+        """
+
+        raise NotImplementedError
+
 
 def double_oracle(
     row_matrix: np.ndarray, eps: float, rng: np.random.Generator
@@ -10,6 +74,8 @@ def double_oracle(
 
     The reference implementation generates the initial restricted game by
     randomly sampling one pure action for each player using `rng.integers`.
+    The restricted game is kept in a `RestrictedGameSolver`, so each iteration
+    only appends the new best responses instead of building a new LP from scratch.
 
     The algorithm terminates when either:
         1. the difference between the upper and the lower bound on the game value drops below `eps`
@@ -33,6 +99,110 @@ def double_oracle(
     raise NotImplementedError
 
 
+class PayoffCache:
+    """A bounded cache of payoff entries queried from a payoff oracle.
+
+    The cached entries are grouped into square blocks of `block_size` x `block_size`
+    joint actions, which are stored in a dictionary keyed by the block coordinates.
+    Entries of a block which have not been queried yet are marked as `np.nan`.
+    When the number of blocks exceeds `max_blocks`, the least recently used block
+    is evicted, which the reference implementation tracks using `collections.OrderedDict`.
+
+    Parameters
+    ----------
+    payoff : Callable[[np.ndarray, np.ndarray], np.ndarray]
+        A function returning the row player's payoffs for the given row and column actions
+        as a matrix of shape (len(row_actions), len(col_actions))
+    block_size : int
+        The number of actions of each player covered by a single block
+    max_blocks : int
+        The maximum number of cached blocks
+
+    Attributes
+    ----------
+    oracle_calls : int
+        The number of calls of `payoff`
+    hits : int
+        The number of queried entries which were found in the cache
+    misses : int
+        The number of queried entries which had to be computed using `payoff`
+    """
+
+    def __init__(
+        self,
+        payoff: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        block_size: int = 64,
+        max_blocks: int = 1024,
+    ) -> None:
+        raise NotImplementedError
+
+    def get(self, row_actions: np.ndarray, col_actions: np.ndarray) -> np.ndarray:
+        """Return the row player's payoffs for the given actions, querying only missing entries.
+
+        Parameters
+        ----------
+        row_actions : np.ndarray
+            The row player's actions
+        col_actions : np.ndarray
+            The column player's actions
+
+        Returns
+        -------
+        np.ndarray
+            The row player's payoff matrix of shape (len(row_actions), len(col_actions))
+        """
+
+        raise NotImplementedError
+
+
+def double_oracle_lazy(
+    payoff: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    row_best_response: Callable[[np.ndarray, np.ndarray], tuple[int, float]],
+    col_best_response: Callable[[np.ndarray, np.ndarray], tuple[int, float]],
+    initial_actions: tuple[int, int],
+    eps: float,
+    block_size: int = 64,
+    max_blocks: int = 1024,
+) -> tuple[list[ArrayPair], list[ArrayPair], dict[str, float]]:
+    """Run Double Oracle on a game which is only accessible through oracles.
+
+    Unlike `double_oracle`, the payoff matrix is never materialized. The payoffs of
+    the restricted game are obtained through a `PayoffCache` wrapping `payoff`, and
+    the best responses are computed by the given oracles. Each oracle receives the
+    opponent's support and the corresponding probabilities, and returns a best
+    response action together with its expected payoff for the row player, which
+    is used to compute the bounds on the game value. The termination conditions
+    are the same as in `double_oracle`.
+
+    Parameters
+    ----------
+    payoff : Callable[[np.ndarray, np.ndarray], np.ndarray]
+        A function returning the row player's payoffs for the given row and column actions
+    row_best_response : Callable[[np.ndarray, np.ndarray], tuple[int, float]]
+        A best response oracle of the row player against a column player's strategy
+    col_best_response : Callable[[np.ndarray, np.ndarray], tuple[int, float]]
+        A best response oracle of the column player against a row player's strategy
+    initial_actions : tuple[int, int]
+        The row and column player's actions forming the initial restricted game
+    eps : float
+        The required accuracy for the approximate Nash equilibrium
+    block_size : int
+        The block size of the payoff cache
+    max_blocks : int
+        The maximum number of blocks kept in the payoff cache
+
+    Returns
+    -------
+    tuple[list[ArrayPair], list[ArrayPair], dict[str, float]]
+        A tuple containing a sequence of strategy profiles over the supports (not full-size,
+        unlike `double_oracle`), a sequence of corresponding supports, and statistics with
+        the numbers of 'payoff_calls', 'best_response_calls', 'cache_hits' and
+        'cache_misses', and the 'cache_hit_rate'
+    """
+
+    raise NotImplementedError
+
+
 def main() -> None:
     pass
 
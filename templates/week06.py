@@ -1,38 +1,71 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterator
+from typing import Literal
+
 import numpy as np
+from scipy import sparse
 
 
-def regret_matching(regrets: np.ndarray) -> np.ndarray:
+def regret_matching(
+    regrets: np.ndarray, mask: np.ndarray | None = None, out: np.ndarray | None = None
+) -> np.ndarray:
     """Generate a strategy based on the given cumulative regrets.
 
+    If `regrets` is a two-dimensional array, a strategy is generated for each row.
+    If `out` is given, the strategy is written into it without allocating new arrays.
+
     Parameters
     ----------
     regrets : np.ndarray
-        The vector containing cumulative regret of each action
+        The vector containing cumulative regret of each action, or a stack of such vectors
+    mask : np.ndarray | None
+        An optional boolean array of the same shape as `regrets` marking legal actions,
+        which are the only ones receiving a positive probability
+    out : np.ndarray | None
+        An optional array of the same shape as `regrets` to store the result in
 
     Returns
     -------
     np.ndarray
-        The generated strategy
+        The generated strategy, or a stack of strategies
     """
 
     raise NotImplementedError
 
 
 def regret_minimization(
-    row_matrix: np.ndarray, col_matrix: np.ndarray, num_iters: int
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    plus: bool = False,
+    alternating: bool = False,
+    averaging: Literal['uniform', 'linear', 'quadratic'] = 'uniform',
 ) -> list[tuple[np.ndarray, np.ndarray]]:
     """Run Regret Minimization for a given number of iterations.
 
+    All regret, strategy, payoff and average strategy vectors are allocated once
+    before the first iteration and updated in place afterwards, e.g. using the `out`
+    argument of `regret_matching` and NumPy ufuncs. Only the returned average
+    strategy profiles are copied. The default arguments correspond to vanilla
+    simultaneous regret matching with uniform averaging, while the combination
+    of Regret Matching+, alternating updates and linear averaging typically
+    converges an order of magnitude faster.
+
     Parameters
     ----------
-    row_matrix : np.ndarray
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The row player's payoff matrix
-    col_matrix : np.ndarray
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
         The column player's payoff matrix
     num_iters : int
         The number of iterations to run the algorithm for
+    plus : bool
+        Whether to use Regret Matching+, which clips the cumulative regrets at zero
+    alternating : bool
+        Whether the column player updates its regrets only after the row player's update
+    averaging : Literal['uniform', 'linear', 'quadratic']
+        Whether the strategy from iteration `t` enters the average with weight 1, `t` or `t^2`
 
     Returns
     -------
@@ -43,6 +76,261 @@ def regret_minimization(
     raise NotImplementedError
 
 
+def regret_minimization_stream(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    checkpoints: np.ndarray | None = None,
+    plus: bool = False,
+    alternating: bool = False,
+    averaging: Literal['uniform', 'linear', 'quadratic'] = 'uniform',
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Regret Minimization and lazily yield the average strategy profiles.
+
+    Without `checkpoints`, the generator yields the same sequence of profiles as
+    `regret_minimization`. Combined with `run_with_early_stopping` from week 3,
+    the algorithm can be stopped as soon as the average strategies are close
+    enough to an equilibrium.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    num_iters : int
+        The number of iterations to run the algorithm for
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the average
+        strategy profile is yielded, or `None` to yield it after every iteration
+    plus : bool
+        Whether to use Regret Matching+, which clips the cumulative regrets at zero
+    alternating : bool
+        Whether the column player updates its regrets only after the row player's update
+    averaging : Literal['uniform', 'linear', 'quadratic']
+        Whether the strategy from iteration `t` enters the average with weight 1, `t` or `t^2`
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the average strategy profile at the next checkpoint
+    """
+
+    raise NotImplementedError
+
+
+def predictive_regret_matching_plus(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    checkpoints: np.ndarray | None = None,
+    last_iterate: bool = False,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Predictive Regret Matching+ and lazily yield the strategy profiles.
+
+    In each iteration, the strategies are generated by `regret_matching` from
+    the clipped cumulative regrets plus a prediction of the next instantaneous
+    regrets, for which the reference implementation uses the last observed ones.
+    The strategies are averaged quadratically, which gives fast convergence of
+    the average strategies in zero-sum games.
+
+    The output format is the same as in `regret_minimization_stream`.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    num_iters : int
+        The number of iterations to run the algorithm for
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the strategy
+        profile is yielded, or `None` to yield it after every iteration
+    last_iterate : bool
+        Whether to yield the current strategies instead of the average ones
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the strategy profile at the next checkpoint
+    """
+
+    raise NotImplementedError
+
+
+def optimistic_hedge(
+    row_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    col_matrix: np.ndarray | sparse.sparray | sparse.spmatrix,
+    num_iters: int,
+    learning_rate: float,
+    checkpoints: np.ndarray | None = None,
+    last_iterate: bool = False,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Optimistic Hedge (Optimistic Multiplicative Weights) and lazily yield the profiles.
+
+    In each iteration, the strategy of a player is proportional to
+    `exp(learning_rate * (cumulative_payoffs + last_payoffs))`, where the last payoff
+    vector serves as the prediction of the next one. The reference implementation
+    subtracts the maximum before exponentiating to avoid overflows. The average
+    strategies are uniform averages of the iterates. In zero-sum games, the last
+    iterates converge to a Nash equilibrium for a small enough `learning_rate`.
+
+    The output format is the same as in `regret_minimization_stream`.
+
+    Parameters
+    ----------
+    row_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The row player's payoff matrix
+    col_matrix : np.ndarray | sparse.sparray | sparse.spmatrix
+        The column player's payoff matrix
+    num_iters : int
+        The number of iterations to run the algorithm for
+    learning_rate : float
+        The learning rate of the multiplicative weights update
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the strategy
+        profile is yielded, or `None` to yield it after every iteration
+    last_iterate : bool
+        Whether to yield the current strategies instead of the average ones
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the strategy profile at the next checkpoint
+    """
+
+    raise NotImplementedError
+
+
+def regret_minimization_batched(
+    row_matrices: np.ndarray,
+    col_matrices: np.ndarray,
+    row_masks: np.ndarray,
+    col_masks: np.ndarray,
+    num_iters: int,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Run Regret Minimization on a batch of games in lockstep.
+
+    All games are advanced simultaneously using vectorized operations over the
+    leading axis, and `regret_matching` is applied row-wise to the stacked regrets.
+    Padded actions always keep zero regret and zero probability. For each game,
+    the result matches `regret_minimization` run on the unpadded payoff matrices.
+
+    Parameters
+    ----------
+    row_matrices : np.ndarray
+        The row players' payoff matrices zero-padded into an array of shape (g, n, m)
+    col_matrices : np.ndarray
+        The column players' payoff matrices zero-padded into an array of shape (g, n, m)
+    row_masks : np.ndarray
+        Boolean array of shape (g, n) marking the row players' legal actions
+    col_masks : np.ndarray
+        Boolean array of shape (g, m) marking the column players' legal actions
+    num_iters : int
+        The number of iterations to run the algorithm for
+
+    Returns
+    -------
+    list[tuple[np.ndarray, np.ndarray]]
+        The sequence of `num_iters` average strategy profiles stacked into arrays
+        of shape (g, n) and (g, m), with zero probability assigned to padded actions
+    """
+
+    raise NotImplementedError
+
+
+def predictive_regret_matching_plus_batched(
+    row_matrices: np.ndarray,
+    col_matrices: np.ndarray,
+    row_masks: np.ndarray,
+    col_masks: np.ndarray,
+    num_iters: int,
+    checkpoints: np.ndarray | None = None,
+    last_iterate: bool = False,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Predictive Regret Matching+ on a batch of games in lockstep.
+
+    All games are advanced simultaneously as in `regret_minimization_batched`.
+    Padded actions always keep zero regret and zero probability. For each game,
+    the yielded strategies match `predictive_regret_matching_plus` run on the
+    unpadded payoff matrices.
+
+    Parameters
+    ----------
+    row_matrices : np.ndarray
+        The row players' payoff matrices zero-padded into an array of shape (g, n, m)
+    col_matrices : np.ndarray
+        The column players' payoff matrices zero-padded into an array of shape (g, n, m)
+    row_masks : np.ndarray
+        Boolean array of shape (g, n) marking the row players' legal actions
+    col_masks : np.ndarray
+        Boolean array of shape (g, m) marking the column players' legal actions
+    num_iters : int
+        The number of iterations to run the algorithm for
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the strategy
+        profiles are yielded, or `None` to yield them after every iteration
+    last_iterate : bool
+        Whether to yield the current strategies instead of the average ones
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the strategy profiles at the next checkpoint stacked into arrays
+        of shape (g, n) and (g, m), with zero probability assigned to padded actions
+    """
+
+    raise NotImplementedError
+
+
+def optimistic_hedge_batched(
+    row_matrices: np.ndarray,
+    col_matrices: np.ndarray,
+    row_masks: np.ndarray,
+    col_masks: np.ndarray,
+    num_iters: int,
+    learning_rate: float,
+    checkpoints: np.ndarray | None = None,
+    last_iterate: bool = False,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Run Optimistic Hedge on a batch of games in lockstep.
+
+    All games are advanced simultaneously as in `regret_minimization_batched`.
+    The reference implementation sets the exponents of padded actions to `-np.inf`,
+    so they always get zero probability. For each game, the yielded strategies
+    match `optimistic_hedge` run on the unpadded payoff matrices.
+
+    Parameters
+    ----------
+    row_matrices : np.ndarray
+        The row players' payoff matrices zero-padded into an array of shape (g, n, m)
+    col_matrices : np.ndarray
+        The column players' payoff matrices zero-padded into an array of shape (g, n, m)
+    row_masks : np.ndarray
+        Boolean array of shape (g, n) marking the row players' legal actions
+    col_masks : np.ndarray
+        Boolean array of shape (g, m) marking the column players' legal actions
+    num_iters : int
+        The number of iterations to run the algorithm for
+    learning_rate : float
+        The learning rate of the multiplicative weights update
+    checkpoints : np.ndarray | None
+        Sorted iteration numbers between 1 and `num_iters` after which the strategy
+        profiles are yielded, or `None` to yield them after every iteration
+    last_iterate : bool
+        Whether to yield the current strategies instead of the average ones
+
+    Yields
+    ------
+    tuple[np.ndarray, np.ndarray]
+        A copy of the strategy profiles at the next checkpoint stacked into arrays
+        of shape (g, n) and (g, m), with zero probability assigned to padded actions
+    """
+
+    raise NotImplementedError
+
+
 def main() -> None:
     pass
 
@@ -3,23 +3,94 @@
 """
 Extensive-form games assignments.
 
-Starting this week, the templates will no longer contain exact function
-signatures and there will not be any automated tests like we had for the
-normal-form games assignments. Instead, we will provide sample outputs
-produced by the reference implementations which you can use to verify
-your solutions. The reason for this change is that there are many valid
-ways to represent game trees (e.g. flat array-based vs. pointer-based),
+Starting this week, the templates will mostly no longer contain exact
+function signatures and there will not be any automated tests like we had
+for the normal-form games assignments. Instead, we will provide sample
+outputs produced by the reference implementations which you can use to
+verify your solutions. The reason for this change is that there are many
+valid ways to represent game trees (e.g. flat array-based vs. pointer-based),
 information sets and strategies in extensive-form games. Figuring out
 the most suitable representations is an important part of assignments
 in this block. Unfortunately, this freedom makes automated testing
 pretty much impossible.
+
+The only exception is the game tree itself. `FlatTree` and `traverse_tree`
+describe the flat array-based representation used by the reference
+implementation, which we recommend as a starting point because it allows
+the algorithms to run as vectorized passes over arrays. The remaining
+functions take whatever arguments your chosen representations need.
 """
 
+from dataclasses import dataclass
+
 import numpy as np
 
 
-def traverse_tree(*args, **kwargs):
-    """Build a full extensive-form game tree for a given game."""
+@dataclass
+class FlatTree:
+    """A game tree stored as a struct of arrays in breadth-first order.
+
+    Node 0 is the root and every node is stored before its children. The children
+    of node `i` occupy the contiguous range `child_offset[i]:child_offset[i + 1]`,
+    so algorithms can process the tree by vectorized passes over depth levels
+    instead of recursion.
+
+    Attributes
+    ----------
+    parent : np.ndarray
+        Index of the parent of each node (-1 for the root), shape (num_nodes,)
+    child_offset : np.ndarray
+        Offsets of the children of each node, shape (num_nodes + 1,)
+    action : np.ndarray
+        Action leading from the parent to each node (-1 for the root)
+    player : np.ndarray
+        Acting player of each node (-1 for chance nodes, -2 for terminal nodes)
+    infoset : np.ndarray
+        Information set index of each decision node (-1 for chance and terminal nodes)
+    chance_prob : np.ndarray
+        Probability of the chance outcome leading to each node (1 if the parent is not
+        a chance node)
+    utility : np.ndarray
+        Utilities of both players at terminal nodes (0 elsewhere), shape (num_nodes, 2)
+    depth : np.ndarray
+        Depth of each node, shape (num_nodes,)
+    """
+
+    parent: np.ndarray
+    child_offset: np.ndarray
+    action: np.ndarray
+    player: np.ndarray
+    infoset: np.ndarray
+    chance_prob: np.ndarray
+    utility: np.ndarray
+    depth: np.ndarray
+
+
+def traverse_tree(env, seed: int = 0) -> FlatTree:
+    """Build a full extensive-form game tree for a given game.
+
+    The tree is expanded level by level starting from `env.init(seed)`, where the
+    environment is `KuhnPokerNumpy`, `LeducPokerNumpy` or their much faster native
+    counterparts `KuhnPokerNative` and `LeducPokerNative`. Only legal actions are
+    expanded, chance probabilities are read from `state.chance_strategy` and terminal
+    utilities from `state.rewards`. Decision nodes of the same player are assigned
+    the same information set index iff they share the player's private card, the
+    public cards revealed so far (the public card in the second round of Leduc Poker)
+    and the public action history. The representation is only a suggestion, feel free
+    to use a different one.
+
+    Parameters
+    ----------
+    env : KuhnPokerNumpy | LeducPokerNumpy | KuhnPokerNative | LeducPokerNative
+        The game environment
+    seed : int
+        Seed used to initialize the environment
+
+    Returns
+    -------
+    FlatTree
+        The flat game tree
+    """
 
     raise NotImplementedError
 
@@ -62,6 +133,8 @@ def main() -> None:
     # We wrap the original implementation to add an explicit chance player and convert
     # everything from JAX arrays to Numpy arrays. There's also a JAX version which you
     # can import using `from kuhn_poker import KuhnPoker` if interested ;)
+    # For traversing the whole game tree, `from kuhn_poker import KuhnPokerNative` provides
+    # a pure NumPy reimplementation with the same interface, which is much faster.
     env = KuhnPoker()
 
     # Initialize the environment with a random seed
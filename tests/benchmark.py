@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+
+"""
+Convergence benchmark for the normal-form game solvers.
+
+The benchmark runs Fictitious Play (week 3), Double Oracle (week 5) and Regret
+Minimization (week 6) on random games of increasing size and records the wall
+clock time, the peak memory usage and the exploitability of the produced
+strategies. The results are stored in machine-readable JSON and CSV files, and
+can be compared against a previously stored baseline to detect slowdowns.
+
+It also traverses the full game trees of Kuhn and Leduc poker with the pgx-backed
+environments and with their pure NumPy reimplementations, and checks that the
+NumPy environments are at least `--min-speedup` times faster.
+
+Execute `python tests/benchmark.py --help` from the repository root to see all options.
+"""
+
+import argparse
+import copy
+import csv
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+sys.path.append('solutions')
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import week03
+import week05
+import week06
+from utils import create_general_sum_game, create_zero_sum_game
+
+SIZES = tuple(2**i for i in range(3, 13))
+BASE_SEED = 141
+
+POKER_GAMES = ('kuhn_poker', 'leduc_poker')
+SOLVERS = ('fictitious_play', 'fictitious_play_naive', 'double_oracle', 'regret_minimization')
+GAME_KINDS = ('zero_sum', 'general_sum')
+FIELDS = (
+    'solver',
+    'game_kind',
+    'size',
+    'iterations',
+    'wall_time',
+    'peak_memory',
+    'exploitability',
+)
+
+
+def create_game(
+    game_kind: str, size: int, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Generate a random square game of the given kind and size."""
+
+    if game_kind == 'zero_sum':
+        row_matrix = create_zero_sum_game(size + 1, rng, min_size=size)
+        return row_matrix, -row_matrix
+
+    return create_general_sum_game(size + 1, rng, min_size=size)
+
+
+def create_stream(
+    solver: str, row_matrix: np.ndarray, col_matrix: np.ndarray, num_iters: int
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Create a lazy stream of average strategy profiles of an iterative solver."""
+
+    checkpoints = week03.log_spaced_checkpoints(num_iters, 50)
+
+    if solver == 'regret_minimization':
+        return week06.regret_minimization_stream(row_matrix, col_matrix, num_iters, checkpoints)
+
+    naive = solver == 'fictitious_play_naive'
+    return week03.fictitious_play_stream(row_matrix, col_matrix, num_iters, naive, checkpoints)
+
+
+def measure_peak_memory(run: Callable[[], object]) -> int:
+    """Measure the peak memory allocated by a function in a separate pass.
+
+    Tracing every allocation slows the function down considerably, so the timing
+    is always measured in different runs with `tracemalloc` disabled.
+    """
+
+    tracemalloc.start()
+    run()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak_memory
+
+
+def run_iterative_solver(
+    solver: str, row_matrix: np.ndarray, col_matrix: np.ndarray, num_iters: int, repeats: int
+) -> tuple[dict, list[tuple[float, float]]]:
+    """Run an iterative solver and record its exploitability over time.
+
+    Time spent computing the exploitability is excluded from the measurements. The run
+    with the smallest wall clock time out of `repeats` runs is reported.
+    """
+
+    def exploitability(strategy: tuple[np.ndarray, np.ndarray]) -> float:
+        return float(week03.compute_exploitability(row_matrix, col_matrix, *strategy))
+
+    def consume() -> None:
+        for _ in create_stream(solver, row_matrix, col_matrix, num_iters):
+            pass
+
+    best_trace = None
+
+    for _ in range(repeats):
+        trace = []
+        wall_time = 0.0
+
+        stream = create_stream(solver, row_matrix, col_matrix, num_iters)
+        start = time.perf_counter()
+
+        for strategy in stream:
+            wall_time += time.perf_counter() - start
+            trace.append((wall_time, exploitability(strategy)))
+            start = time.perf_counter()
+
+        if best_trace is None or wall_time < best_trace[-1][0]:
+            best_trace = trace
+
+    result = {
+        'iterations': num_iters,
+        'wall_time': best_trace[-1][0],
+        'peak_memory': measure_peak_memory(consume),
+        'exploitability': best_trace[-1][1],
+    }
+
+    return result, best_trace
+
+
+def run_double_oracle(
+    row_matrix: np.ndarray,
+    col_matrix: np.ndarray,
+    eps: float,
+    rng: np.random.Generator,
+    repeats: int,
+) -> tuple[dict, list[tuple[float, float]]]:
+    """Run Double Oracle and record the exploitability of its final profile.
+
+    Every run starts from a copy of the same random generator, so that all runs are
+    identical and the smallest wall clock time out of `repeats` runs is reported.
+    """
+
+    def run() -> list[tuple[np.ndarray, np.ndarray]]:
+        strategies, _ = week05.double_oracle(row_matrix, eps, copy.deepcopy(rng))
+        return strategies
+
+    wall_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        strategies = run()
+        wall_times.append(time.perf_counter() - start)
+
+    wall_time = min(wall_times)
+    exploitability = float(week03.compute_exploitability(row_matrix, col_matrix, *strategies[-1]))
+    result = {
+        'iterations': len(strategies),
+        'wall_time': wall_time,
+        'peak_memory': measure_peak_memory(run),
+        'exploitability': exploitability,
+    }
+
+    return result, [(wall_time, exploitability)]
+
+
+def run_benchmark(
+    solvers: list[str],
+    game_kinds: list[str],
+    sizes: list[int],
+    num_iters: int,
+    eps: float,
+    repeats: int,
+) -> tuple[list[dict], dict[tuple[str, int], dict[str, list[tuple[float, float]]]]]:
+    """Run all combinations of solvers, game kinds and sizes.
+
+    Returns
+    -------
+    tuple[list[dict], dict[tuple[str, int], dict[str, list[tuple[float, float]]]]]
+        A list of result records and the exploitability traces grouped by game
+    """
+
+    results = []
+    traces = {}
+
+    for game_kind in game_kinds:
+        for size in sizes:
+            rng = np.random.default_rng(BASE_SEED + size)
+            row_matrix, col_matrix = create_game(game_kind, size, rng)
+
+            for solver in solvers:
+                # Double Oracle is defined only for zero-sum games
+                if solver == 'double_oracle':
+                    if game_kind != 'zero_sum':
+                        continue
+
+                    result, trace = run_double_oracle(row_matrix, col_matrix, eps, rng, repeats)
+                else:
+                    result, trace = run_iterative_solver(
+                        solver, row_matrix, col_matrix, num_iters, repeats
+                    )
+
+                results.append({'solver': solver, 'game_kind': game_kind, 'size': size, **result})
+                traces.setdefault((game_kind, size), {})[solver] = trace
+
+                print(
+                    f'{solver:>24} {game_kind:>12} {size:>5}: '
+                    f'{result["wall_time"]:9.3f} s, {result["peak_memory"] / 2**20:9.1f} MiB, '
+                    f'exploitability {result["exploitability"]:.5f}'
+                )
+
+    return results, traces
+
+
+def save_results(results: list[dict], output_dir: Path) -> None:
+    """Store the result records as JSON and CSV."""
+
+    with open(output_dir / 'results.json', 'w') as file:
+        json.dump(results, file, indent=2)
+
+    with open(output_dir / 'results.csv', 'w', newline='') as file:
+        writer = csv.DictWriter(file, FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def plot_traces(
+    traces: dict[tuple[str, int], dict[str, list[tuple[float, float]]]], output_dir: Path
+) -> None:
+    """Plot exploitability against wall clock time, one figure per game."""
+
+    for (game_kind, size), solver_traces in traces.items():
+        fig, ax = plt.subplots()
+
+        for solver, trace in solver_traces.items():
+            wall_times, exploitabilities = np.transpose(trace)
+            marker = 'o' if len(trace) == 1 else None
+            ax.plot(wall_times, exploitabilities, marker=marker, label=solver)
+
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Wall time [s]')
+        ax.set_ylabel('Exploitability')
+        ax.set_title(f'{game_kind} game of size {size}x{size}')
+        ax.legend()
+
+        fig.savefig(output_dir / f'exploitability_{game_kind}_{size}.pdf', bbox_inches='tight')
+        plt.close(fig)
+
+
+def plot_memory(results: list[dict], output_dir: Path) -> None:
+    """Plot the final exploitability against the peak memory usage, one figure per game kind.
+
+    Each solver is drawn as a line connecting its results on games of increasing size.
+    """
+
+    for game_kind in sorted({record['game_kind'] for record in results}):
+        fig, ax = plt.subplots()
+
+        for solver in SOLVERS:
+            records = [
+                record
+                for record in results
+                if record['solver'] == solver and record['game_kind'] == game_kind
+            ]
+
+            if not records:
+                continue
+
+            records.sort(key=lambda record: record['size'])
+            peak_memories = [record['peak_memory'] / 2**20 for record in records]
+            exploitabilities = [record['exploitability'] for record in records]
+            ax.plot(peak_memories, exploitabilities, marker='o', label=solver)
+
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Peak memory [MiB]')
+        ax.set_ylabel('Exploitability')
+        ax.set_title(f'{game_kind} games of increasing size')
+        ax.legend()
+
+        fig.savefig(output_dir / f'memory_{game_kind}.pdf', bbox_inches='tight')
+        plt.close(fig)
+
+
+def find_regressions(
+    results: list[dict], baseline: list[dict], tolerance: float, min_time: float
+) -> list[str]:
+    """Find solvers which became slower than the baseline by more than `tolerance` times.
+
+    Differences smaller than `min_time` seconds are ignored, because the timings of the
+    smallest games are dominated by noise.
+    """
+
+    def key(record: dict) -> tuple[str, str, int]:
+        return record['solver'], record['game_kind'], record['size']
+
+    baseline_times = {key(record): record['wall_time'] for record in baseline}
+    regressions = []
+
+    for record in results:
+        baseline_time = baseline_times.get(key(record))
+
+        if baseline_time is None:
+            continue
+
+        wall_time = record['wall_time']
+
+        if wall_time > tolerance * baseline_time and wall_time - baseline_time > min_time:
+            solver, game_kind, size = key(record)
+            regressions.append(
+                f'{solver} on {game_kind} game of size {size}: '
+                f'{record["wall_time"]:.3f} s vs. baseline {baseline_time:.3f} s'
+            )
+
+    return regressions
+
+
+def count_nodes(env: Any, state: Any) -> int:
+    """Count the nodes of the game tree below `state` by stepping through every legal action."""
+
+    if state.terminated:
+        return 1
+
+    actions = [action for action, legal in enumerate(state.legal_action_mask.tolist()) if legal]
+
+    return 1 + sum(count_nodes(env, env.step(state, action)) for action in actions)
+
+
+def run_poker_benchmark(games: list[str], repeats: int) -> list[dict]:
+    """Compare the full tree traversal times of the pgx-backed and NumPy poker environments."""
+
+    # The poker environments import JAX, so they are only loaded when benchmarked
+    import kuhn_poker
+    import leduc_poker
+
+    environments = {
+        'kuhn_poker': (kuhn_poker.KuhnPokerNumpy, kuhn_poker.KuhnPokerNative),
+        'leduc_poker': (leduc_poker.LeducPokerNumpy, leduc_poker.LeducPokerNative),
+    }
+    results = []
+
+    for game in games:
+        record = {'game': game}
+
+        for name, env in zip(('pgx', 'native'), (cls() for cls in environments[game])):
+            # The first traversal compiles the jitted pgx functions and fills the caches
+            record['nodes'] = count_nodes(env, env.init(0))
+            elapsed_times = []
+
+            for _ in range(repeats):
+                start = time.perf_counter()
+                count_nodes(env, env.init(0))
+                elapsed_times.append(time.perf_counter() - start)
+
+            record[f'{name}_time'] = min(elapsed_times)
+
+        record['speedup'] = record['pgx_time'] / record['native_time']
+        results.append(record)
+
+        print(
+            f'{game:>24}: {record["nodes"]:>6} nodes, pgx {record["pgx_time"]:.3f} s, '
+            f'native {record["native_time"]:.4f} s, speedup {record["speedup"]:.1f}x'
+        )
+
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--solvers', nargs='+', choices=SOLVERS, default=list(SOLVERS))
+    parser.add_argument('--game-kinds', nargs='+', choices=GAME_KINDS, default=list(GAME_KINDS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--num-iters', type=int, default=1000)
+    parser.add_argument('--eps', type=float, default=1e-2, help='Accuracy of Double Oracle')
+    parser.add_argument('--poker-games', nargs='*', choices=POKER_GAMES, default=list(POKER_GAMES))
+    parser.add_argument(
+        '--min-speedup',
+        type=float,
+        default=50.0,
+        help='Required speedup of the NumPy poker environments over the pgx-backed ones',
+    )
+    parser.add_argument(
+        '--repeats', type=int, default=3, help='Number of timed runs, the fastest is reported'
+    )
+    parser.add_argument('--output-dir', type=Path, default=Path('benchmark_results'))
+    parser.add_argument('--baseline', type=Path, help='JSON results to compare against')
+    parser.add_argument(
+        '--tolerance', type=float, default=1.2, help='Allowed slowdown relative to the baseline'
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.05,
+        help='Slowdowns below this many seconds are never reported as regressions',
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    results, traces = run_benchmark(
+        args.solvers, args.game_kinds, args.sizes, args.num_iters, args.eps, args.repeats
+    )
+    save_results(results, args.output_dir)
+    plot_traces(traces, args.output_dir)
+    plot_memory(results, args.output_dir)
+
+    poker_results = run_poker_benchmark(args.poker_games, args.repeats)
+
+    with open(args.output_dir / 'poker_results.json', 'w') as file:
+        json.dump(poker_results, file, indent=2)
+
+    regressions = [
+        f'native {record["game"]} is only {record["speedup"]:.1f}x faster than pgx'
+        for record in poker_results
+        if record['speedup'] < args.min_speedup
+    ]
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        regressions += find_regressions(results, baseline, args.tolerance, args.min_time)
+
+    for regression in regressions:
+        print(f'Regression: {regression}')
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
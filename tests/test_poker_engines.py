@@ -0,0 +1,57 @@
+import dataclasses
+import sys
+
+sys.path.append('solutions')
+
+import numpy as np
+import pytest
+
+import kuhn_poker
+import leduc_poker
+
+NativeEnv = kuhn_poker.KuhnPokerNative | leduc_poker.LeducPokerNative
+ReferenceEnv = kuhn_poker.KuhnPokerNumpy | leduc_poker.LeducPokerNumpy
+NativeState = kuhn_poker.NativeState | leduc_poker.NativeState
+ReferenceState = kuhn_poker.State | leduc_poker.State
+
+
+def verify_state(state: NativeState, reference: ReferenceState) -> None:
+    for name in [field.name for field in dataclasses.fields(state)] + ['observation']:
+        value = getattr(state, name)
+        expected = getattr(reference, name)
+
+        if isinstance(value, np.ndarray):
+            assert value.dtype == expected.dtype, f'Incorrect dtype of {name}!'
+
+        # Arrays other than the lazily computed observation are shared between states
+        if isinstance(value, np.ndarray) and name != 'observation':
+            assert not value.flags.writeable, f'Shared array {name} is writeable!'
+
+        assert np.array_equal(value, expected), f'Incorrect value of {name}!'
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize(
+    'env, reference_env',
+    [
+        (kuhn_poker.KuhnPokerNative(), kuhn_poker.KuhnPokerNumpy()),
+        (leduc_poker.LeducPokerNative(), leduc_poker.LeducPokerNumpy()),
+    ],
+    ids=['kuhn_poker', 'leduc_poker'],
+)
+def test_native_poker_matches_pgx(env: NativeEnv, reference_env: ReferenceEnv, seed: int) -> None:
+    # Compare both implementations step-for-step over the whole game tree
+    stack = [(env.init(seed), reference_env.init(seed))]
+    num_nodes = 0
+
+    while stack:
+        state, reference = stack.pop()
+        num_nodes += 1
+
+        verify_state(state, reference)
+
+        if not state.terminated:
+            for action in np.flatnonzero(state.legal_action_mask):
+                stack.append((env.step(state, action), reference_env.step(reference, action)))
+
+    assert num_nodes > 1, 'The game tree was not traversed!'
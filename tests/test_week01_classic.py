@@ -10,10 +10,15 @@ from pytest import FixtureRequest
 from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
 
 import week01
-from utils import cache_data_stream_per_function, parameterize_classical_tests
+from utils import (
+    cache_data_stream_per_function,
+    create_random_strategy,
+    parameterize_classical_tests,
+)
 
 NUM_GAMES = 9
 NUM_ZERO_SUM_GAMES = 2
+NUM_PROFILES = 16
 BASE_SEED = 101
 
 
@@ -85,6 +90,62 @@ def test_evaluate_zero_sum(
     )
 
 
+@pytest.mark.parametrize('general_sum_data_stream', range(NUM_GAMES), indirect=True)
+def test_evaluate_general_sum_batched(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    row_strategies = np.stack([create_random_strategy(num_rows, rng) for _ in range(NUM_PROFILES)])
+    col_strategies = np.stack([create_random_strategy(num_cols, rng) for _ in range(NUM_PROFILES)])
+
+    utilities = week01.evaluate_general_sum_batched(
+        row_matrix, col_matrix, row_strategies, col_strategies
+    )
+    expected_utilities = np.stack(
+        [
+            week01.evaluate_general_sum(row_matrix, col_matrix, row_strategy, col_strategy)
+            for row_strategy, col_strategy in zip(row_strategies, col_strategies)
+        ]
+    )
+
+    assert utilities.dtype == np.float64, 'Incorrect dtype!'
+    assert utilities.shape == (NUM_PROFILES, 2), 'Incorrect shape!'
+    assert np.allclose(utilities, expected_utilities), 'Batched utilities do not match!'
+
+    out = np.empty((NUM_PROFILES, 2), np.float64)
+    result = week01.evaluate_general_sum_batched(
+        row_matrix, col_matrix, row_strategies, col_strategies, out=out
+    )
+
+    assert result is out, 'The output buffer was not reused!'
+    assert np.allclose(out, expected_utilities), 'Batched utilities do not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(NUM_ZERO_SUM_GAMES), indirect=True)
+def test_evaluate_zero_sum_batched(
+    zero_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, *_ = next(zero_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    row_strategies = np.stack([create_random_strategy(num_rows, rng) for _ in range(NUM_PROFILES)])
+    col_strategies = np.stack([create_random_strategy(num_cols, rng) for _ in range(NUM_PROFILES)])
+
+    utilities = week01.evaluate_zero_sum_batched(row_matrix, row_strategies, col_strategies)
+    expected_utilities = np.stack(
+        [
+            week01.evaluate_zero_sum(row_matrix, row_strategy, col_strategy)
+            for row_strategy, col_strategy in zip(row_strategies, col_strategies)
+        ]
+    )
+
+    assert utilities.dtype == np.float64, 'Incorrect dtype!'
+    assert utilities.shape == (NUM_PROFILES, 2), 'Incorrect shape!'
+    assert np.allclose(utilities, expected_utilities), 'Batched utilities do not match!'
+
+
 @pytest.mark.parametrize('general_sum_data_stream', range(NUM_GAMES), indirect=True)
 def test_best_response_against_row(
     general_sum_data_stream: Generator,
@@ -184,6 +245,31 @@ def test_find_strictly_dominated_actions(
     )
 
 
+@pytest.mark.parametrize('dominance_data_stream', range(NUM_GAMES), indirect=True)
+def test_find_strictly_dominated_actions_mixed(dominance_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(dominance_data_stream)
+
+    for matrix in (row_matrix, np.transpose(col_matrix)):
+        pure_dominated_actions = week01.find_strictly_dominated_actions(matrix)
+        mixed_dominated_actions = week01.find_strictly_dominated_actions(matrix, mixed=True)
+
+        assert mixed_dominated_actions.dtype == np.int64, 'Incorrect dtype!'
+        assert np.all(np.isin(pure_dominated_actions, mixed_dominated_actions)), (
+            'Actions dominated by pure actions are missing!'
+        )
+
+
+def test_find_strictly_dominated_actions_by_mixture() -> None:
+    # The last action is not dominated by any pure action, but it is dominated by (0.5, 0.5, 0)
+    matrix = np.array([[3, 0], [0, 3], [1, 1]], np.float64)
+
+    pure_dominated_actions = week01.find_strictly_dominated_actions(matrix)
+    mixed_dominated_actions = week01.find_strictly_dominated_actions(matrix, mixed=True)
+
+    assert pure_dominated_actions.size == 0, 'Found a non-existent pure domination!'
+    assert np.array_equal(np.sort(mixed_dominated_actions), [2]), 'Missed a mixed domination!'
+
+
 @pytest.mark.parametrize('dominance_data_stream', range(NUM_GAMES), indirect=True)
 def test_iterated_removal_of_dominated_strategies(
     dominance_data_stream: Generator,
@@ -210,3 +296,40 @@ def test_iterated_removal_of_dominated_strategies(
         },
         f'{request.node.originalname}{request.node.callspec.indices["dominance_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('dominance_data_stream', range(NUM_GAMES), indirect=True)
+def test_iterated_removal_of_dominated_strategies_incremental(
+    dominance_data_stream: Generator,
+) -> None:
+    row_matrix, col_matrix, *_ = next(dominance_data_stream)
+
+    expected = week01.iterated_removal_of_dominated_strategies(row_matrix, col_matrix)
+    *reduced, elimination_order = week01.iterated_removal_of_dominated_strategies_incremental(
+        row_matrix, col_matrix
+    )
+
+    assert elimination_order.dtype == np.int64, 'Incorrect dtype!'
+
+    for actual_array, expected_array in zip(reduced, expected):
+        assert actual_array.dtype == expected_array.dtype, 'Incorrect dtype!'
+        assert np.array_equal(actual_array, expected_array), 'Reduced games do not match!'
+
+    # Replay the elimination order and check that every removed action was strictly dominated
+    row_actions = np.arange(row_matrix.shape[0])
+    col_actions = np.arange(col_matrix.shape[1])
+
+    for player, action in elimination_order.reshape(-1, 2):
+        if player == 0:
+            matrix = row_matrix[np.ix_(row_actions, col_actions)]
+            dominated_actions = row_actions[week01.find_strictly_dominated_actions(matrix)]
+            assert action in dominated_actions, 'Removed row action is not dominated!'
+            row_actions = row_actions[row_actions != action]
+        else:
+            matrix = np.transpose(col_matrix[np.ix_(row_actions, col_actions)])
+            dominated_actions = col_actions[week01.find_strictly_dominated_actions(matrix)]
+            assert action in dominated_actions, 'Removed column action is not dominated!'
+            col_actions = col_actions[col_actions != action]
+
+    assert np.array_equal(row_actions, expected[2]), 'Elimination order is incomplete!'
+    assert np.array_equal(col_actions, expected[3]), 'Elimination order is incomplete!'
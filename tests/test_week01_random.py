@@ -1,6 +1,7 @@
 import hashlib
 import sys
 from collections.abc import Generator
+from pathlib import Path
 
 sys.path.append('solutions')
 
@@ -8,13 +9,16 @@ import numpy as np
 import pytest
 from pytest import FixtureRequest
 from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
+from scipy import sparse
 
 import week01
 from utils import (
     cache_data_stream_per_function,
+    create_memmap_matrix,
     parameterize_random_dominance_tests,
     parameterize_random_general_sum_tests,
     parameterize_random_zero_sum_tests,
+    sparsify_game,
 )
 
 BASE_SEED = 101
@@ -213,3 +217,112 @@ def test_iterated_removal_of_dominated_strategies(
         },
         f'{request.node.originalname}{request.node.callspec.indices["dominance_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_sparse_payoff_matrices(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, row_strategy, col_strategy = next(general_sum_data_stream)
+    row_matrix, col_matrix = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+    sparse_row_matrix = sparse.csr_array(row_matrix)
+    sparse_col_matrix = sparse.csc_array(col_matrix)
+
+    utilities = week01.evaluate_general_sum(
+        sparse_row_matrix, sparse_col_matrix, row_strategy, col_strategy
+    )
+    expected_utilities = week01.evaluate_general_sum(
+        row_matrix, col_matrix, row_strategy, col_strategy
+    )
+
+    assert np.allclose(utilities, expected_utilities), 'Sparse utilities do not match!'
+
+    # Compare the values of the best responses, since sparse games often contain ties
+    best_response = week01.calculate_best_response_against_row(sparse_col_matrix, row_strategy)
+    best_response_values = row_strategy @ col_matrix
+
+    assert best_response.dtype == np.float64, 'Incorrect dtype!'
+    assert np.isclose(best_response_values @ best_response, np.max(best_response_values)), (
+        'The best response against the row player is not optimal!'
+    )
+
+    best_response = week01.calculate_best_response_against_col(sparse_row_matrix, col_strategy)
+    best_response_values = row_matrix @ col_strategy
+
+    assert best_response.dtype == np.float64, 'Incorrect dtype!'
+    assert np.isclose(best_response_values @ best_response, np.max(best_response_values)), (
+        'The best response against the column player is not optimal!'
+    )
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_sparse_zero_sum_payoff_matrices(
+    zero_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, row_strategy, col_strategy = next(zero_sum_data_stream)
+    row_matrix, _ = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+
+    row_strategies = rng.dirichlet(np.ones(row_matrix.shape[0]), 4)
+    col_strategies = rng.dirichlet(np.ones(row_matrix.shape[1]), 4)
+
+    expected_utilities = week01.evaluate_zero_sum(row_matrix, row_strategy, col_strategy)
+    expected_batched_utilities = week01.evaluate_zero_sum_batched(
+        row_matrix, row_strategies, col_strategies
+    )
+
+    # Both the sparse arrays and the older sparse matrices are accepted
+    for sparse_row_matrix in (sparse.csr_array(row_matrix), sparse.csc_matrix(row_matrix)):
+        utilities = week01.evaluate_zero_sum(sparse_row_matrix, row_strategy, col_strategy)
+
+        assert utilities.dtype == np.float64, 'Incorrect dtype!'
+        assert np.allclose(utilities, expected_utilities), 'Sparse utilities do not match!'
+
+        batched_utilities = week01.evaluate_zero_sum_batched(
+            sparse_row_matrix, row_strategies, col_strategies
+        )
+
+        assert batched_utilities.dtype == np.float64, 'Incorrect dtype!'
+        assert np.allclose(batched_utilities, expected_batched_utilities), (
+            'Sparse batched utilities do not match!'
+        )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_memmap_payoff_matrices(general_sum_data_stream: Generator, tmp_path: Path) -> None:
+    row_matrix, col_matrix, row_strategy, col_strategy = next(general_sum_data_stream)
+    memmap_row_matrix = create_memmap_matrix(row_matrix, tmp_path / 'row_matrix.npy')
+    memmap_col_matrix = create_memmap_matrix(col_matrix, tmp_path / 'col_matrix.npy')
+
+    for chunk_size in (1, 7, None):
+        col_best_response = week01.calculate_best_response_against_row(
+            memmap_col_matrix, row_strategy, chunk_size=chunk_size
+        )
+        row_best_response = week01.calculate_best_response_against_col(
+            memmap_row_matrix, col_strategy, chunk_size=chunk_size
+        )
+
+        assert col_best_response.dtype == np.float64, 'Incorrect dtype!'
+        assert row_best_response.dtype == np.float64, 'Incorrect dtype!'
+
+        assert np.array_equal(
+            col_best_response, week01.calculate_best_response_against_row(col_matrix, row_strategy)
+        ), 'Chunked best response does not match!'
+        assert np.array_equal(
+            row_best_response, week01.calculate_best_response_against_col(row_matrix, col_strategy)
+        ), 'Chunked best response does not match!'
+
+        row_utility = week01.evaluate_row_against_best_response(
+            memmap_row_matrix, memmap_col_matrix, row_strategy, chunk_size=chunk_size
+        )
+        col_utility = week01.evaluate_col_against_best_response(
+            memmap_row_matrix, memmap_col_matrix, col_strategy, chunk_size=chunk_size
+        )
+
+        assert np.isclose(
+            row_utility,
+            week01.evaluate_row_against_best_response(row_matrix, col_matrix, row_strategy),
+        ), 'Chunked utility does not match!'
+        assert np.isclose(
+            col_utility,
+            week01.evaluate_col_against_best_response(row_matrix, col_matrix, col_strategy),
+        ), 'Chunked utility does not match!'
@@ -12,6 +12,7 @@ from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
 import week02
 from utils import (
     cache_data_stream_per_function,
+    contains_profile,
     create_random_support,
     parameterize_random_general_sum_tests,
     parameterize_random_zero_sum_tests,
@@ -136,3 +137,135 @@ def test_support_enumeration_zero_sum(
         {f'{i}': np.concatenate(x) for i, x in enumerate(equilibria)},
         f'{request.node.originalname}{request.node.callspec.indices["zero_sum_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_support_enumeration_parallel(general_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+
+    expected_equilibria = week02.support_enumeration(row_matrix, col_matrix)
+
+    for max_workers in (2, 3):
+        equilibria = week02.support_enumeration(row_matrix, col_matrix, max_workers=max_workers)
+
+        assert len(equilibria) == len(expected_equilibria), 'Incorrect number of equilibria!'
+
+        for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+            equilibria, expected_equilibria
+        ):
+            assert np.array_equal(row_strategy, expected_row_strategy), 'Order is not stable!'
+            assert np.array_equal(col_strategy, expected_col_strategy), 'Order is not stable!'
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_pruned_support_enumeration(general_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+
+    # Random games are non-degenerate, so pruning must not lose any equilibria
+    expected_equilibria = week02.support_enumeration(row_matrix, col_matrix)
+    equilibria = week02.pruned_support_enumeration(row_matrix, col_matrix)
+
+    assert len(equilibria) == len(expected_equilibria), 'Incorrect number of equilibria!'
+
+    for row_strategy, col_strategy in equilibria:
+        assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+        assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+        assert contains_profile(expected_equilibria, row_strategy, col_strategy), (
+            'Found a non-existent equilibrium!'
+        )
+
+    equilibria = week02.pruned_support_enumeration(row_matrix, col_matrix, first_only=True)
+
+    assert len(equilibria) == 1, 'Incorrect number of equilibria!'
+    assert contains_profile(expected_equilibria, *equilibria[0]), (
+        'Found a non-existent equilibrium!'
+    )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_lemke_howson(general_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    expected_equilibria = week02.support_enumeration(row_matrix, col_matrix)
+
+    for initial_label in range(num_rows + num_cols):
+        row_strategy, col_strategy = week02.lemke_howson(row_matrix, col_matrix, initial_label)
+
+        assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+        assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+        assert contains_profile(expected_equilibria, row_strategy, col_strategy), (
+            'Found a non-existent equilibrium!'
+        )
+
+    equilibria = week02.lemke_howson_all_labels(row_matrix, col_matrix, max_workers=2)
+
+    for i, (row_strategy, col_strategy) in enumerate(equilibria):
+        assert contains_profile(expected_equilibria, row_strategy, col_strategy), (
+            'Found a non-existent equilibrium!'
+        )
+
+        assert not contains_profile(equilibria[:i], row_strategy, col_strategy), (
+            'Found a duplicate equilibrium!'
+        )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_verify_supports_batched(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, *_ = next(general_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    support_size = rng.integers(1, min(num_rows, num_cols) + 1, None)
+    row_supports = np.stack(
+        [np.sort(rng.choice(num_rows, support_size, replace=False)) for _ in range(16)]
+    )
+    col_supports = np.stack(
+        [np.sort(rng.choice(num_cols, support_size, replace=False)) for _ in range(16)]
+    )
+
+    results = week02.verify_supports_batched(row_matrix, row_supports, col_supports)
+
+    assert len(results) == len(row_supports), 'Incorrect number of results!'
+
+    for col_probs, row_support, col_support in zip(results, row_supports, col_supports):
+        expected_col_probs = week02.verify_support(row_matrix, row_support, col_support)
+
+        if not np.any(expected_col_probs):
+            assert not np.any(col_probs), 'Found a non-existent candidate!'
+        else:
+            assert col_probs.dtype == np.float64, 'Incorrect dtype!'
+            assert np.allclose(col_probs, expected_col_probs), 'Candidates do not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_compute_best_response_value_function(zero_sum_data_stream: Generator) -> None:
+    row_matrix, *_ = next(zero_sum_data_stream)
+    row_matrix = row_matrix[:2]
+
+    def value_function(probs: np.ndarray) -> np.ndarray:
+        return np.min(np.outer(probs, row_matrix[0]) + np.outer(1 - probs, row_matrix[1]), axis=1)
+
+    breakpoints, values, (maximin_prob, game_value) = (
+        week02.compute_best_response_value_function(row_matrix)
+    )
+
+    assert breakpoints.dtype == np.float64, 'Incorrect dtype!'
+    assert values.dtype == np.float64, 'Incorrect dtype!'
+
+    assert np.isclose(breakpoints[0], 0.0) and np.isclose(breakpoints[-1], 1.0), (
+        'Breakpoints do not cover the whole interval!'
+    )
+    assert np.all(np.diff(breakpoints) >= 0), 'Breakpoints are not sorted!'
+    assert np.allclose(values, value_function(breakpoints)), 'Incorrect envelope values!'
+
+    grid = np.linspace(0.0, 1.0, 1001)
+    grid_values = value_function(grid)
+
+    assert np.all(grid_values <= game_value + 1e-8), 'The maximin value is not maximal!'
+    assert np.isclose(value_function(np.array([maximin_prob]))[0], game_value), (
+        'The maximin point does not lie on the envelope!'
+    )
@@ -1,4 +1,5 @@
 import hashlib
+import itertools
 import sys
 from collections.abc import Generator
 
@@ -15,6 +16,7 @@ from utils import cache_data_stream_per_function, parameterize_classical_tests
 NUM_GAMES = 9
 NUM_ZERO_SUM_GAMES = 2
 BASE_SEED = 141
+TIE_TOLERANCE = 1e-9
 
 
 @pytest.fixture
@@ -128,6 +130,43 @@ def test_fictitious_play(
     )
 
 
+@pytest.mark.parametrize('zero_sum_data_stream', range(NUM_ZERO_SUM_GAMES), indirect=True)
+def test_fictitious_play_recomputed_payoffs(zero_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    # Long enough for the exact ties to be broken differently without the tie tolerance
+    strategies = week03.fictitious_play(row_matrix, col_matrix, num_iters=100, naive=False)
+
+    row_actions = np.eye(row_matrix.shape[0])
+    col_actions = np.eye(row_matrix.shape[1])
+
+    # The first profile consists of the best responses to the uniform strategies
+    row_payoffs = np.mean(row_matrix, axis=1)
+    col_payoffs = np.mean(col_matrix, axis=0)
+
+    row_action = np.flatnonzero(row_payoffs >= np.max(row_payoffs) - TIE_TOLERANCE)[0]
+    col_action = np.flatnonzero(col_payoffs >= np.max(col_payoffs) - TIE_TOLERANCE)[0]
+
+    assert np.allclose(strategies[0][0], row_actions[row_action]), 'Incorrect initial strategy!'
+    assert np.allclose(strategies[0][1], col_actions[col_action]), 'Incorrect initial strategy!'
+
+    pairs = itertools.pairwise(strategies)
+
+    for num_profiles, ((row_strategy, col_strategy), (next_row, next_col)) in enumerate(pairs, 1):
+        # Recompute the expected payoffs against the average strategies from scratch
+        row_payoffs = row_matrix @ col_strategy
+        col_payoffs = row_strategy @ col_matrix
+
+        row_action = np.flatnonzero(row_payoffs >= np.max(row_payoffs) - TIE_TOLERANCE)[0]
+        col_action = np.flatnonzero(col_payoffs >= np.max(col_payoffs) - TIE_TOLERANCE)[0]
+
+        expected_row = row_strategy + (row_actions[row_action] - row_strategy) / (num_profiles + 1)
+        expected_col = col_strategy + (col_actions[col_action] - col_strategy) / (num_profiles + 1)
+
+        assert np.allclose(next_row, expected_row), 'Trajectories do not match!'
+        assert np.allclose(next_col, expected_col), 'Trajectories do not match!'
+
+
 @pytest.mark.parametrize('zero_sum_data_stream', range(NUM_ZERO_SUM_GAMES), indirect=True)
 def test_fictitious_play_naive(
     zero_sum_data_stream: Generator,
@@ -1,6 +1,8 @@
 import hashlib
 import sys
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Iterator
+from pathlib import Path
 
 sys.path.append('solutions')
 
@@ -8,12 +10,16 @@ import numpy as np
 import pytest
 from pytest import FixtureRequest
 from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
+from scipy import sparse
 
 import week03
 from utils import (
     cache_data_stream_per_function,
+    create_memmap_matrix,
+    pad_games,
     parameterize_random_general_sum_tests,
     parameterize_random_zero_sum_tests,
+    sparsify_game,
 )
 
 BASE_SEED = 141
@@ -160,3 +166,217 @@ def test_fictitious_play_naive(
         },
         f'{request.node.originalname}{request.node.callspec.indices["zero_sum_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_fictitious_play_sparse(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    row_matrix, col_matrix = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+
+    strategies = week03.fictitious_play(
+        sparse.csr_array(row_matrix), sparse.csr_array(col_matrix), num_iters=5, naive=False
+    )
+    expected_strategies = week03.fictitious_play(row_matrix, col_matrix, num_iters=5, naive=False)
+
+    assert len(strategies) == 5, 'Incorrect number of strategies returned!'
+
+    for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+        strategies, expected_strategies
+    ):
+        assert isinstance(row_strategy, np.ndarray), 'Strategies must be dense arrays!'
+        assert isinstance(col_strategy, np.ndarray), 'Strategies must be dense arrays!'
+
+        assert np.allclose(row_strategy, expected_row_strategy), 'Sparse strategies do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Sparse strategies do not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_fictitious_play_memmap(zero_sum_data_stream: Generator, tmp_path: Path) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    # The row player's updates read columns, which are only contiguous in column-major order
+    memmap_row_matrix = create_memmap_matrix(
+        np.asfortranarray(row_matrix), tmp_path / 'row_matrix.npy'
+    )
+    memmap_col_matrix = create_memmap_matrix(col_matrix, tmp_path / 'col_matrix.npy')
+
+    assert memmap_row_matrix.flags.f_contiguous, 'The row matrix is not column-major!'
+
+    strategies = week03.fictitious_play(
+        memmap_row_matrix, memmap_col_matrix, num_iters=5, naive=False, chunk_size=3
+    )
+    expected_strategies = week03.fictitious_play(row_matrix, col_matrix, num_iters=5, naive=False)
+
+    assert len(strategies) == 5, 'Incorrect number of strategies returned!'
+
+    for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+        strategies, expected_strategies
+    ):
+        assert np.allclose(row_strategy, expected_row_strategy), 'Chunked strategies do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Chunked strategies do not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_fictitious_play_stream(zero_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    expected_strategies = week03.fictitious_play(row_matrix, col_matrix, num_iters=50, naive=False)
+    strategies = list(
+        week03.fictitious_play_stream(row_matrix, col_matrix, num_iters=50, naive=False)
+    )
+
+    assert len(strategies) == 50, 'Incorrect number of strategies returned!'
+
+    for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+        strategies, expected_strategies
+    ):
+        assert np.allclose(row_strategy, expected_row_strategy), 'Strategies do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Strategies do not match!'
+
+    checkpoints = week03.log_spaced_checkpoints(50, 10)
+
+    assert checkpoints[0] == 1 and checkpoints[-1] == 50, 'Missing first or last iteration!'
+    assert len(checkpoints) <= 10, 'Too many checkpoints!'
+    assert np.all(np.diff(checkpoints) > 0), 'Checkpoints are not strictly increasing!'
+
+    strategies = list(
+        week03.fictitious_play_stream(
+            row_matrix, col_matrix, num_iters=50, naive=False, checkpoints=checkpoints
+        )
+    )
+
+    assert len(strategies) == len(checkpoints), 'Incorrect number of strategies returned!'
+
+    for (row_strategy, col_strategy), checkpoint in zip(strategies, checkpoints):
+        expected_row_strategy, expected_col_strategy = expected_strategies[checkpoint - 1]
+
+        assert np.allclose(row_strategy, expected_row_strategy), 'Strategies do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Strategies do not match!'
+
+
+def test_fictitious_play_batched(general_sum_data_stream: Generator) -> None:
+    games = [tuple(next(general_sum_data_stream)[:2]) for _ in range(5)]
+    row_matrices, col_matrices, row_masks, col_masks = pad_games(games)
+
+    strategies = week03.fictitious_play_batched(
+        row_matrices, col_matrices, row_masks, col_masks, num_iters=5, naive=False
+    )
+
+    assert len(strategies) == 5, 'Incorrect number of strategies returned!'
+
+    for i, (row_matrix, col_matrix) in enumerate(games):
+        num_rows, num_cols = row_matrix.shape
+        expected_strategies = week03.fictitious_play(
+            row_matrix, col_matrix, num_iters=5, naive=False
+        )
+
+        for (row_strategies, col_strategies), expected_strategy in zip(
+            strategies, expected_strategies
+        ):
+            expected_row_strategy, expected_col_strategy = expected_strategy
+
+            assert row_strategies.dtype == np.float64, 'Incorrect dtype!'
+            assert col_strategies.dtype == np.float64, 'Incorrect dtype!'
+
+            assert np.allclose(row_strategies[i, :num_rows], expected_row_strategy), (
+                'Batched strategies do not match!'
+            )
+            assert np.allclose(col_strategies[i, :num_cols], expected_col_strategy), (
+                'Batched strategies do not match!'
+            )
+            assert not np.any(row_strategies[i, num_rows:]), 'Padded actions are played!'
+            assert not np.any(col_strategies[i, num_cols:]), 'Padded actions are played!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_compute_exploitability_trace(zero_sum_data_stream: Generator, tmp_path: Path) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    strategies = week03.fictitious_play(row_matrix, col_matrix, num_iters=100, naive=False)
+    row_strategies = np.stack([row_strategy for row_strategy, _ in strategies])
+    col_strategies = np.stack([col_strategy for _, col_strategy in strategies])
+
+    exploitability = week03.compute_exploitability_trace(
+        row_matrix, col_matrix, row_strategies, col_strategies, chunk_size=7
+    )
+    expected_exploitability = np.array(
+        [week03.compute_exploitability(row_matrix, col_matrix, *x) for x in strategies]
+    )
+
+    assert exploitability.dtype == np.float64, 'Incorrect dtype!'
+    assert np.allclose(exploitability, expected_exploitability), 'Exploitability does not match!'
+
+    iterations = np.arange(1, 101)
+
+    for method in ('log', 'lttb'):
+        sampled_iterations, sampled_values = week03.downsample_trace(
+            iterations, exploitability, 10, method
+        )
+
+        assert len(sampled_iterations) <= 10, 'Too many points!'
+        assert sampled_iterations[0] == 1 and sampled_iterations[-1] == 100, (
+            'Missing first or last point!'
+        )
+        assert np.allclose(sampled_values, exploitability[sampled_iterations - 1]), (
+            'Sampled values do not match the trace!'
+        )
+
+    week03.save_exploitability_trace(
+        tmp_path / 'trace.npz', iterations, exploitability, 'Fictitious Play'
+    )
+    trace = np.load(tmp_path / 'trace.npz')
+
+    assert np.array_equal(trace['iterations'], iterations), 'Saved iterations do not match!'
+    assert np.array_equal(trace['exploitability'], exploitability), 'Saved trace does not match!'
+    assert trace['label'] == 'Fictitious Play', 'Saved label does not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_run_with_early_stopping(zero_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    def exploitability(strategy: tuple[np.ndarray, np.ndarray]) -> float:
+        return week03.compute_exploitability(row_matrix, col_matrix, *strategy)
+
+    strategies = week03.fictitious_play_stream(row_matrix, col_matrix, num_iters=1000, naive=False)
+    strategy, report = week03.run_with_early_stopping(strategies, exploitability, eps=1.0)
+
+    assert 1 <= report['iterations'] <= 1000, 'Incorrect number of iterations!'
+    assert report['elapsed_time'] >= 0.0, 'Incorrect elapsed time!'
+    assert np.isclose(report['exploitability'], exploitability(strategy)), (
+        'Incorrect final exploitability!'
+    )
+    assert report['exploitability'] <= 1.0 or report['iterations'] == 1000, (
+        'Stopped before reaching the target exploitability!'
+    )
+
+    expected_strategy = week03.fictitious_play(
+        row_matrix, col_matrix, num_iters=int(report['iterations']), naive=False
+    )[-1]
+
+    assert np.allclose(strategy[0], expected_strategy[0]), 'Strategies do not match!'
+    assert np.allclose(strategy[1], expected_strategy[1]), 'Strategies do not match!'
+
+    # A zero time budget stops the solver at the first check
+    strategies = week03.fictitious_play_stream(row_matrix, col_matrix, num_iters=1000, naive=False)
+    _, report = week03.run_with_early_stopping(
+        strategies, exploitability, eps=0.0, time_budget=0.0
+    )
+
+    assert report['iterations'] == 1, 'The time budget was not respected!'
+
+    def slow_strategies() -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        for strategy in week03.fictitious_play_stream(
+            row_matrix, col_matrix, num_iters=100, naive=False
+        ):
+            time.sleep(0.01)
+            yield strategy
+
+    # The budget runs out after ten profiles, between the checks at iterations 8 and 16
+    _, report = week03.run_with_early_stopping(
+        slow_strategies(), exploitability, eps=0.0, time_budget=0.1
+    )
+
+    assert report['iterations'] <= 11, 'The time budget was overshot!'
@@ -8,12 +8,14 @@ import numpy as np
 import pytest
 from pytest import FixtureRequest
 from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
+from scipy import sparse
 
 import week04
 from utils import (
     cache_data_stream_per_function,
     parameterize_random_general_sum_tests,
     parameterize_random_zero_sum_tests,
+    sparsify_game,
 )
 
 BASE_SEED = 141
@@ -94,3 +96,166 @@ def test_find_correlated_equilibrium_general_sum(
         {'correlated_equilibrium': corr_equi},
         f'{request.node.originalname}{request.node.callspec.indices["general_sum_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_find_nash_equilibrium_sparse(
+    zero_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+    row_matrix, _ = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+
+    row_strategy, col_strategy = week04.find_nash_equilibrium(sparse.csc_array(row_matrix))
+    expected_row_strategy, expected_col_strategy = week04.find_nash_equilibrium(row_matrix)
+
+    assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+    assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+    # Equilibria need not be unique, but the value of the game is
+    assert np.isclose(
+        row_strategy @ row_matrix @ col_strategy,
+        expected_row_strategy @ row_matrix @ expected_col_strategy,
+    ), 'The game values do not match!'
+
+
+def test_nash_equilibrium_solver(zero_sum_data_stream: Generator, rng: np.random.Generator) -> None:
+    row_matrix, *_ = next(zero_sum_data_stream)
+    solver = week04.NashEquilibriumSolver(*row_matrix.shape)
+
+    for _ in range(5):
+        # Solve a sequence of slightly perturbed games
+        row_matrix = row_matrix + rng.normal(0.0, 0.1, row_matrix.shape)
+
+        row_strategy, col_strategy = solver.solve(row_matrix)
+        expected_row_strategy, expected_col_strategy = week04.find_nash_equilibrium(row_matrix)
+
+        assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+        assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+        assert np.isclose(
+            row_strategy @ row_matrix @ col_strategy,
+            expected_row_strategy @ row_matrix @ expected_col_strategy,
+        ), 'The game values do not match!'
+
+        assert solver.solve_time >= 0.0, 'Incorrect solve time!'
+        assert solver.num_iterations >= 0, 'Incorrect number of iterations!'
+
+    # Re-solving the same game starts from an optimal basis, so no pivots are needed
+    solver.solve(row_matrix)
+
+    assert solver.num_iterations == 0, 'The solver was not warm-started!'
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_build_correlated_equilibrium_constraints(general_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    constraints = week04.build_correlated_equilibrium_constraints(row_matrix, col_matrix)
+
+    assert sparse.issparse(constraints), 'Constraints are not sparse!'
+    assert constraints.nnz <= num_rows * num_cols * (num_rows + num_cols), 'Too many non-zeros!'
+
+    expected_constraints = []
+
+    for action in range(num_rows):
+        for deviation in range(num_rows):
+            if action != deviation:
+                constraint = np.zeros((num_rows, num_cols))
+                constraint[action] = row_matrix[deviation] - row_matrix[action]
+                expected_constraints.append(constraint.reshape(-1))
+
+    for action in range(num_cols):
+        for deviation in range(num_cols):
+            if action != deviation:
+                constraint = np.zeros((num_rows, num_cols))
+                constraint[:, action] = col_matrix[:, deviation] - col_matrix[:, action]
+                expected_constraints.append(constraint.reshape(-1))
+
+    assert np.allclose(constraints.toarray(), np.stack(expected_constraints)), (
+        'Constraints do not match!'
+    )
+
+    corr_equi = week04.find_correlated_equilibrium(row_matrix, col_matrix)
+
+    assert np.all(constraints @ corr_equi.reshape(-1) <= 1e-8), 'Constraints are violated!'
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_find_correlated_equilibrium_methods(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    constraints = week04.build_correlated_equilibrium_constraints(row_matrix, col_matrix)
+
+    distribution = rng.random(row_matrix.shape)
+    distribution = distribution / np.sum(distribution)
+    gap = week04.compute_correlated_equilibrium_gap(row_matrix, col_matrix, distribution)
+
+    assert gap.dtype == np.float64, 'Incorrect dtype!'
+    assert np.isclose(gap, max(0.0, np.max(constraints @ distribution.reshape(-1)))), (
+        'Incorrect correlated equilibrium gap!'
+    )
+
+    # The approximate method only needs to be accurate relative to the range of the payoffs
+    payoff_range = max(np.ptp(row_matrix), np.ptp(col_matrix))
+
+    # The default number of iterations is far more than these games need to reach the gaps
+    for method, eps in (
+        ('lp', 1e-6),
+        ('column_generation', 1e-6),
+        ('regret_matching', 0.01 * payoff_range),
+    ):
+        corr_equi = week04.find_correlated_equilibrium(row_matrix, col_matrix, method, eps)
+        gap = week04.compute_correlated_equilibrium_gap(row_matrix, col_matrix, corr_equi)
+
+        assert corr_equi.dtype == np.float64, 'Incorrect dtype!'
+        assert np.all(corr_equi >= -1e-9), 'Negative probabilities!'
+        assert np.isclose(np.sum(corr_equi), 1.0), 'Distribution does not sum to 1!'
+        assert gap <= eps + 1e-8, f'The gap of the {method} method is too large!'
+
+    # Running out of iterations still returns a valid distribution
+    corr_equi = week04.find_correlated_equilibrium(
+        row_matrix, col_matrix, 'regret_matching', eps=0.0, max_iters=1
+    )
+
+    assert np.all(corr_equi >= -1e-9), 'Negative probabilities!'
+    assert np.isclose(np.sum(corr_equi), 1.0), 'Distribution does not sum to 1!'
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_find_correlated_equilibrium_sparse(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    row_matrix, col_matrix = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+    sparse_row_matrix = sparse.csr_array(row_matrix)
+    sparse_col_matrix = sparse.csr_array(col_matrix)
+
+    distribution = rng.random(row_matrix.shape)
+    distribution = distribution / np.sum(distribution)
+
+    sparse_gap = week04.compute_correlated_equilibrium_gap(
+        sparse_row_matrix, sparse_col_matrix, distribution
+    )
+    gap = week04.compute_correlated_equilibrium_gap(row_matrix, col_matrix, distribution)
+
+    assert np.isclose(sparse_gap, gap), 'The sparse and dense gaps do not match!'
+
+    payoff_range = max(np.ptp(row_matrix), np.ptp(col_matrix))
+
+    for method, eps in (
+        ('lp', 1e-6),
+        ('column_generation', 1e-6),
+        ('regret_matching', 0.01 * payoff_range),
+    ):
+        corr_equi = week04.find_correlated_equilibrium(
+            sparse_row_matrix, sparse_col_matrix, method, eps
+        )
+        gap = week04.compute_correlated_equilibrium_gap(row_matrix, col_matrix, corr_equi)
+
+        assert isinstance(corr_equi, np.ndarray), 'The distribution is not a dense array!'
+        assert corr_equi.dtype == np.float64, 'Incorrect dtype!'
+        assert np.all(corr_equi >= -1e-9), 'Negative probabilities!'
+        assert np.isclose(np.sum(corr_equi), 1.0), 'Distribution does not sum to 1!'
+        assert gap <= eps + 1e-8, f'The gap of the sparse {method} method is too large!'
@@ -75,3 +75,93 @@ def test_double_oracle(
         },
         f'{request.node.originalname}{request.node.callspec.indices["zero_sum_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_restricted_game_solver(zero_sum_data_stream: Generator, rng: np.random.Generator) -> None:
+    row_matrix, *_ = next(zero_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+    solver = week05.RestrictedGameSolver(initial_capacity=1)
+
+    solver.add_row(0, np.empty(0))
+    solver.add_col(0, row_matrix[:1, 0])
+
+    for _ in range(20):
+        if rng.random() < 0.5:
+            action = rng.integers(0, num_rows, None)
+            if action not in solver.row_actions:
+                solver.add_row(action, row_matrix[action, solver.col_actions])
+        else:
+            action = rng.integers(0, num_cols, None)
+            if action not in solver.col_actions:
+                solver.add_col(action, row_matrix[solver.row_actions, action])
+
+        row_strategy, col_strategy, value = solver.solve()
+        restricted_matrix = row_matrix[np.ix_(solver.row_actions, solver.col_actions)]
+
+        assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+        assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+        # Both strategies must guarantee the value of the restricted game
+        assert np.isclose(row_strategy @ restricted_matrix @ col_strategy, value), (
+            'Incorrect value of the restricted game!'
+        )
+        assert np.all(row_strategy @ restricted_matrix >= value - 1e-8), (
+            'The row strategy is not optimal!'
+        )
+        assert np.all(restricted_matrix @ col_strategy <= value + 1e-8), (
+            'The column strategy is not optimal!'
+        )
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_double_oracle_lazy(zero_sum_data_stream: Generator, rng: np.random.Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    def payoff(row_actions: np.ndarray, col_actions: np.ndarray) -> np.ndarray:
+        return row_matrix[np.ix_(row_actions, col_actions)]
+
+    def row_best_response(support: np.ndarray, probs: np.ndarray) -> tuple[int, float]:
+        values = row_matrix[:, support] @ probs
+        return int(np.argmax(values)), float(np.max(values))
+
+    def col_best_response(support: np.ndarray, probs: np.ndarray) -> tuple[int, float]:
+        values = probs @ row_matrix[support]
+        return int(np.argmin(values)), float(np.min(values))
+
+    initial_actions = (rng.integers(0, num_rows, None), rng.integers(0, num_cols, None))
+
+    # A tiny cache forces evictions, which must not change the result
+    results = [
+        week05.double_oracle_lazy(
+            payoff, row_best_response, col_best_response, initial_actions, 1e-2, 4, max_blocks
+        )
+        for max_blocks in (1, 1024)
+    ]
+
+    for strategies, supports, stats in results:
+        (row_strategy, col_strategy), (row_support, col_support) = strategies[-1], supports[-1]
+
+        full_row_strategy = np.zeros(num_rows)
+        full_row_strategy[row_support] = row_strategy
+        full_col_strategy = np.zeros(num_cols)
+        full_col_strategy[col_support] = col_strategy
+
+        exploitability = week03.compute_exploitability(
+            row_matrix, col_matrix, full_row_strategy, full_col_strategy
+        )
+
+        assert exploitability <= 1e-2 + 1e-8, 'The final profile is too exploitable!'
+        assert stats['payoff_calls'] > 0, 'Incorrect number of payoff calls!'
+        assert stats['best_response_calls'] > 0, 'Incorrect number of best response calls!'
+        assert np.isclose(
+            stats['cache_hit_rate'],
+            stats['cache_hits'] / max(1, stats['cache_hits'] + stats['cache_misses']),
+        ), 'Incorrect cache hit rate!'
+
+    assert np.allclose(results[0][0][-1][0], results[1][0][-1][0]), 'Strategies do not match!'
+    assert np.allclose(results[0][0][-1][1], results[1][0][-1][1]), 'Strategies do not match!'
+    assert results[0][2]['cache_misses'] >= results[1][2]['cache_misses'], (
+        'A smaller cache cannot miss less often!'
+    )
@@ -8,13 +8,16 @@ import numpy as np
 import pytest
 from pytest import FixtureRequest
 from pytest_regressions.ndarrays_regression import NDArraysRegressionFixture
+from scipy import sparse
 
 import week03
 import week06
 from utils import (
     cache_data_stream_per_function,
+    pad_games,
     parameterize_random_general_sum_tests,
     parameterize_random_zero_sum_tests,
+    sparsify_game,
 )
 
 BASE_SEED = 141
@@ -104,3 +107,200 @@ def test_regret_minimization_zero_sum(
         },
         f'{request.node.originalname}{request.node.callspec.indices["zero_sum_data_stream"]}',
     )
+
+
+@pytest.mark.parametrize('general_sum_data_stream', range(5), indirect=True)
+def test_regret_minimization_sparse(
+    general_sum_data_stream: Generator, rng: np.random.Generator
+) -> None:
+    row_matrix, col_matrix, *_ = next(general_sum_data_stream)
+    row_matrix, col_matrix = sparsify_game(row_matrix, col_matrix, 0.3, rng)
+
+    strategies = week06.regret_minimization(
+        sparse.csr_array(row_matrix), sparse.csc_array(col_matrix), num_iters=5
+    )
+    expected_strategies = week06.regret_minimization(row_matrix, col_matrix, num_iters=5)
+
+    assert len(strategies) == 5, 'Incorrect number of strategies returned!'
+
+    for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+        strategies, expected_strategies
+    ):
+        assert np.allclose(row_strategy, expected_row_strategy), 'Sparse strategies do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Sparse strategies do not match!'
+
+
+def test_regret_minimization_batched(general_sum_data_stream: Generator) -> None:
+    games = [tuple(next(general_sum_data_stream)[:2]) for _ in range(5)]
+    row_matrices, col_matrices, row_masks, col_masks = pad_games(games)
+
+    strategies = week06.regret_minimization_batched(
+        row_matrices, col_matrices, row_masks, col_masks, num_iters=5
+    )
+
+    assert len(strategies) == 5, 'Incorrect number of strategies returned!'
+
+    for i, (row_matrix, col_matrix) in enumerate(games):
+        num_rows, num_cols = row_matrix.shape
+        expected_strategies = week06.regret_minimization(row_matrix, col_matrix, num_iters=5)
+
+        for (row_strategies, col_strategies), expected_strategy in zip(
+            strategies, expected_strategies
+        ):
+            expected_row_strategy, expected_col_strategy = expected_strategy
+
+            assert row_strategies.dtype == np.float64, 'Incorrect dtype!'
+            assert col_strategies.dtype == np.float64, 'Incorrect dtype!'
+
+            assert np.allclose(row_strategies[i, :num_rows], expected_row_strategy), (
+                'Batched strategies do not match!'
+            )
+            assert np.allclose(col_strategies[i, :num_cols], expected_col_strategy), (
+                'Batched strategies do not match!'
+            )
+            assert not np.any(row_strategies[i, num_rows:]), 'Padded actions are played!'
+            assert not np.any(col_strategies[i, num_cols:]), 'Padded actions are played!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_regret_minimization_modes(zero_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+
+    expected_strategies = week06.regret_minimization(row_matrix, col_matrix, num_iters=5)
+    strategies = week06.regret_minimization(
+        row_matrix, col_matrix, 5, plus=False, alternating=False, averaging='uniform'
+    )
+
+    for (row_strategy, col_strategy), (expected_row_strategy, expected_col_strategy) in zip(
+        strategies, expected_strategies
+    ):
+        assert np.allclose(row_strategy, expected_row_strategy), 'Default modes do not match!'
+        assert np.allclose(col_strategy, expected_col_strategy), 'Default modes do not match!'
+
+    for plus in (False, True):
+        for alternating in (False, True):
+            for averaging in ('uniform', 'linear', 'quadratic'):
+                strategies = week06.regret_minimization(
+                    row_matrix, col_matrix, 100, plus, alternating, averaging
+                )
+
+                assert len(strategies) == 100, 'Incorrect number of strategies returned!'
+
+                for row_strategy, col_strategy in strategies:
+                    assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+                    assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+                    assert np.isclose(np.sum(row_strategy), 1.0), 'Strategy does not sum to 1!'
+                    assert np.isclose(np.sum(col_strategy), 1.0), 'Strategy does not sum to 1!'
+
+                # Returned profiles must not share the internal in-place buffers
+                assert not np.shares_memory(strategies[0][0], strategies[-1][0]), (
+                    'Strategies share memory!'
+                )
+
+
+def test_regret_matching_out(rng: np.random.Generator) -> None:
+    regrets = rng.normal(0.0, 1.0, (4, 10))
+    expected_strategies = np.stack([week06.regret_matching(regret) for regret in regrets])
+
+    out = np.empty_like(regrets)
+    strategies = week06.regret_matching(regrets, out=out)
+
+    assert strategies is out, 'The output buffer was not reused!'
+    assert np.allclose(strategies, expected_strategies), 'Stacked strategies do not match!'
+
+
+@pytest.mark.parametrize('zero_sum_data_stream', range(5), indirect=True)
+def test_optimistic_solvers(zero_sum_data_stream: Generator) -> None:
+    row_matrix, col_matrix, *_ = next(zero_sum_data_stream)
+    num_rows, num_cols = row_matrix.shape
+
+    # Hedge is invariant to shifting the payoffs, so the learning rate is scaled by their range
+    payoff_range = np.ptp(row_matrix)
+    learning_rate = 0.1 / payoff_range
+
+    # The regrets of Optimistic Hedge sum up to at most (log(n) + log(m)) / learning_rate
+    # in zero-sum games, while Predictive Regret Matching+ has to beat the 1 / sqrt(T) rate
+    # of Regret Matching by an order of magnitude
+    bounds = {
+        'predictive_regret_matching_plus': 0.1 * payoff_range / np.sqrt(2000),
+        'optimistic_hedge': (np.log(num_rows) + np.log(num_cols)) / (learning_rate * 2000),
+    }
+
+    solvers = {
+        'predictive_regret_matching_plus': lambda **kwargs: (
+            week06.predictive_regret_matching_plus(row_matrix, col_matrix, 2000, **kwargs)
+        ),
+        'optimistic_hedge': lambda **kwargs: (
+            week06.optimistic_hedge(row_matrix, col_matrix, 2000, learning_rate, **kwargs)
+        ),
+    }
+
+    for name, solver in solvers.items():
+        for last_iterate in (False, True):
+            strategies = list(solver(last_iterate=last_iterate))
+
+            assert len(strategies) == 2000, 'Incorrect number of strategies returned!'
+
+            for row_strategy, col_strategy in strategies:
+                assert row_strategy.dtype == np.float64, 'Incorrect dtype!'
+                assert col_strategy.dtype == np.float64, 'Incorrect dtype!'
+
+                assert np.isclose(np.sum(row_strategy), 1.0), 'Strategy does not sum to 1!'
+                assert np.isclose(np.sum(col_strategy), 1.0), 'Strategy does not sum to 1!'
+
+            first_exploitability = week03.compute_exploitability(
+                row_matrix, col_matrix, *strategies[0]
+            )
+            last_exploitability = week03.compute_exploitability(
+                row_matrix, col_matrix, *strategies[-1]
+            )
+
+            if not last_iterate:
+                assert last_exploitability <= bounds[name], f'{name} converges too slowly!'
+
+            # Only the last iterates of Optimistic Hedge are guaranteed to converge,
+            # but at a game-dependent rate
+            elif name == 'optimistic_hedge':
+                assert last_exploitability <= first_exploitability + 1e-8, (
+                    f'{name} does not converge!'
+                )
+
+        checkpoints = np.array([1, 10, 100, 2000])
+        strategies = list(solver(checkpoints=checkpoints))
+
+        assert len(strategies) == len(checkpoints), 'Incorrect number of strategies returned!'
+
+
+def test_optimistic_solvers_batched(zero_sum_data_stream: Generator) -> None:
+    games = [tuple(next(zero_sum_data_stream)[:2]) for _ in range(5)]
+    row_matrices, col_matrices, row_masks, col_masks = pad_games(games)
+
+    for name in ('predictive_regret_matching_plus', 'optimistic_hedge'):
+        args = (10,) if name == 'predictive_regret_matching_plus' else (10, 1e-3)
+        batched_strategies = list(
+            getattr(week06, f'{name}_batched')(
+                row_matrices, col_matrices, row_masks, col_masks, *args
+            )
+        )
+
+        assert len(batched_strategies) == 10, 'Incorrect number of strategies returned!'
+
+        for i, (row_matrix, col_matrix) in enumerate(games):
+            num_rows, num_cols = row_matrix.shape
+            strategies = list(getattr(week06, name)(row_matrix, col_matrix, *args))
+
+            for (row_strategies, col_strategies), (row_strategy, col_strategy) in zip(
+                batched_strategies, strategies
+            ):
+                assert row_strategies.dtype == np.float64, 'Incorrect dtype!'
+                assert col_strategies.dtype == np.float64, 'Incorrect dtype!'
+
+                assert np.allclose(row_strategies[i, :num_rows], row_strategy), (
+                    'Batched strategies do not match!'
+                )
+                assert np.allclose(col_strategies[i, :num_cols], col_strategy), (
+                    'Batched strategies do not match!'
+                )
+                assert not np.any(row_strategies[i, num_rows:]), 'Padded actions are played!'
+                assert not np.any(col_strategies[i, num_cols:]), 'Padded actions are played!'
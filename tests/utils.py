@@ -1,16 +1,17 @@
 import functools
 from collections.abc import Callable, Generator
+from pathlib import Path
 
 import numpy as np
 
 
 def create_general_sum_game(
-    max_size: int, rng: np.random.Generator
+    max_size: int, rng: np.random.Generator, min_size: int = 2
 ) -> tuple[np.ndarray, np.ndarray]:
     """Generate a random two-player general-sum game."""
 
-    num_rows = rng.integers(2, max_size, None)
-    num_cols = rng.integers(2, max_size, None)
+    num_rows = rng.integers(min_size, max_size, None)
+    num_cols = rng.integers(min_size, max_size, None)
 
     min_utility = rng.integers(-100, 75, None)
     max_utility = rng.integers(min_utility + 1, 100, None)
@@ -25,10 +26,12 @@ def create_general_sum_game(
     return row_matrix, col_matrix
 
 
-def create_zero_sum_game(max_size: int, rng: np.random.Generator) -> np.ndarray:
+def create_zero_sum_game(
+    max_size: int, rng: np.random.Generator, min_size: int = 2
+) -> np.ndarray:
     """Generate a random two-player zero-sum game."""
 
-    return create_general_sum_game(max_size, rng)[0]
+    return create_general_sum_game(max_size, rng, min_size)[0]
 
 
 def create_game_with_dominated_strategies(
@@ -83,6 +86,47 @@ def create_game_with_dominated_strategies(
     return row_matrix, col_matrix
 
 
+def sparsify_game(
+    row_matrix: np.ndarray, col_matrix: np.ndarray, density: float, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Zero out random entries of a game so that roughly `density` of them remain non-zero."""
+
+    mask = rng.random(row_matrix.shape) < density
+
+    return np.where(mask, row_matrix, 0.0), np.where(mask, col_matrix, 0.0)
+
+
+def pad_games(
+    games: list[tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Stack games of different sizes into zero-padded payoff tensors with action masks."""
+
+    num_rows = max(row_matrix.shape[0] for row_matrix, _ in games)
+    num_cols = max(row_matrix.shape[1] for row_matrix, _ in games)
+
+    row_matrices = np.zeros((len(games), num_rows, num_cols), np.float64)
+    col_matrices = np.zeros((len(games), num_rows, num_cols), np.float64)
+    row_masks = np.zeros((len(games), num_rows), np.bool_)
+    col_masks = np.zeros((len(games), num_cols), np.bool_)
+
+    for i, (row_matrix, col_matrix) in enumerate(games):
+        game_rows, game_cols = row_matrix.shape
+        row_matrices[i, :game_rows, :game_cols] = row_matrix
+        col_matrices[i, :game_rows, :game_cols] = col_matrix
+        row_masks[i, :game_rows] = True
+        col_masks[i, :game_cols] = True
+
+    return row_matrices, col_matrices, row_masks, col_masks
+
+
+def create_memmap_matrix(matrix: np.ndarray, path: Path) -> np.memmap:
+    """Store a payoff matrix in a `.npy` file and map it back into memory as read-only."""
+
+    np.save(path, matrix)
+
+    return np.load(path, mmap_mode='r')
+
+
 def create_random_strategy(num_actions: int, rng: np.random.Generator) -> np.ndarray:
     def _create_random_pure_strategy(num_actions, rng):
         strategy = np.zeros(num_actions)
@@ -110,6 +154,20 @@ def create_random_support(num_actions: int, rng: np.random.Generator) -> np.ndar
     return np.sort(support)
 
 
+def contains_profile(
+    profiles: list[tuple[np.ndarray, np.ndarray]],
+    row_strategy: np.ndarray,
+    col_strategy: np.ndarray,
+) -> bool:
+    """Check whether a strategy profile is close to one of the given profiles."""
+
+    return any(
+        np.allclose(row_strategy, other_row_strategy)
+        and np.allclose(col_strategy, other_col_strategy)
+        for other_row_strategy, other_col_strategy in profiles
+    )
+
+
 def parameterize_classical_tests(zero_sum_only: bool, rng: np.random.Generator) -> Generator:
     games = {
         'prisoners_dilemma': (